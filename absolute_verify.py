@@ -1,14 +1,13 @@
 """
 ABSOLUTE VERIFICATION - Check exact DATABASE_URL and query it directly
 """
-import os
-from dotenv import load_dotenv
+import sys
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 # Load .env
-load_dotenv()
-db_url = os.getenv('DATABASE_URL')
+sys.path.append('backend')
+from env import DATABASE_URL as db_url
 
 print("=" * 70)
 print("ABSOLUTE DATABASE VERIFICATION")
@@ -50,7 +49,7 @@ print("=" * 70)
 cur.execute("""
     SELECT id, name, chef_id, created_at, updated_at
     FROM plate_recipes
-    WHERE LOWER(name) LIKE '%butter%chicken%'
+    WHERE name ILIKE '%butter%chicken%'
     ORDER BY updated_at DESC
     LIMIT 1
 """)
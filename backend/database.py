@@ -2,14 +2,21 @@
 Database Operations Module
 Handles all database interactions for recipes, ingredients, and conversations
 """
+import copy
+import csv
+import io
+import json
 import os
+import threading
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values, register_default_json, register_default_jsonb
+from psycopg2.pool import ThreadedConnectionPool
 from typing import Dict, List, Optional, Any
-from dotenv import load_dotenv
-import json
+import orjson
 import logging
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 
 # Import Google Sheets module for real-time sync
 try:
@@ -18,10 +25,14 @@ try:
 except ImportError:
     SHEETS_ENABLED = False
 
-load_dotenv()
+from env import DATABASE_URL
 
 logger = logging.getLogger(__name__)
 
+# Decode json/jsonb columns (conversation state, export_all_for_sheets) with orjson
+register_default_json(loads=orjson.loads, globally=True)
+register_default_jsonb(loads=orjson.loads, globally=True)
+
 # Connection pool
 pool = None
 
@@ -29,13 +40,14 @@ def init_db():
     """Initialize database connection pool"""
     global pool
     if pool is None:
-        database_url = os.getenv('DATABASE_URL')
+        database_url = DATABASE_URL
         if not database_url:
             raise ValueError("DATABASE_URL not found in environment")
         
-        pool = SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
+        # Threaded pool: Flask/Quart handlers call in from worker threads
+        pool = ThreadedConnectionPool(
+            minconn=int(os.getenv('DB_POOL_MIN', '2')),
+            maxconn=int(os.getenv('DB_POOL_MAX', '10')),
             dsn=database_url
         )
         print("✅ Database connection pool initialized")
@@ -80,6 +92,21 @@ def return_connection(conn):
         except:
             pass
 
+@contextmanager
+def get_conn():
+    """
+    Borrow a pooled connection for the duration of a with-block.
+    
+    Usage:
+        with db.get_conn() as conn:
+            ...
+    """
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        return_connection(conn)
+
 def close_connection(conn):
     """Close a bad connection instead of returning to pool"""
     if pool and conn:
@@ -505,6 +532,7 @@ def save_batch_recipe(
                 ))
         
         conn.commit()
+        _invalidate_search_cache(chef_id)
         print(f"✅ Saved batch recipe: {name} ({recipe_id})")
         
         # ==================== CREATE VERSION 1.0 ====================
@@ -656,6 +684,7 @@ def save_plate_recipe(
                 ))
         
         conn.commit()
+        _invalidate_search_cache(chef_id)
         print(f"✅ Saved plate recipe: {name} ({recipe_id})")
         
         # ==================== CREATE VERSION 1.0 ====================
@@ -732,6 +761,355 @@ def save_plate_recipe(
         return_connection(conn)
 
 
+# ==================== BULK SAVES ====================
+
+# Compact ingredient record for the bulk paths (seed data builds these directly).
+# Dict ingredients are converted once on entry; rows are then built by attribute.
+Ingredient = namedtuple(
+    'Ingredient',
+    'name quantity unit preparation_notes is_garnish is_optional category',
+    defaults=(None, None, None, False, False, None)
+)
+
+def _as_ingredients(ingredients: Optional[List]) -> List[Ingredient]:
+    """Normalize a list of Ingredient tuples and/or ingredient dicts to Ingredient tuples"""
+    return [
+        ing if isinstance(ing, Ingredient) else Ingredient(
+            ing['name'], ing.get('quantity'), ing.get('unit'), ing.get('preparation_notes'),
+            ing.get('is_garnish', False), ing.get('is_optional', False), ing.get('category')
+        )
+        for ing in ingredients or []
+    ]
+
+def _unique_recipe_names(cur, chef_id: str, names: List[str], recipe_type: str) -> List[str]:
+    """
+    Bulk counterpart of _get_unique_recipe_name.
+    Fetches the chef's existing names once and resolves 'Name 2', 'Name 3', ...
+    in Python, also keeping names unique within the batch being saved.
+    """
+    table = 'batch_recipes' if recipe_type == 'batch' else 'plate_recipes'
+    cur.execute(f"SELECT LOWER(name) AS name FROM {table} WHERE chef_id = %s", (chef_id,))
+    taken = {row['name'] for row in cur.fetchall()}
+    
+    unique_names = []
+    for name in names:
+        base_name = name.strip()
+        candidate = base_name
+        version = 2
+        while candidate.lower() in taken:
+            candidate = f"{base_name} {version}"
+            version += 1
+        taken.add(candidate.lower())
+        unique_names.append(candidate)
+    
+    return unique_names
+
+
+def _bulk_ingredient_ids(cur, chef_id: str, ingredients: List[Ingredient]) -> Dict[str, str]:
+    """
+    Bulk counterpart of _get_or_create_ingredient.
+    Returns {lowercased name: ingredient_id}, creating missing ingredients in one INSERT.
+    """
+    wanted = {}
+    for ing in ingredients:
+        wanted.setdefault(ing.name.lower(), ing)
+    if not wanted:
+        return {}
+    
+    cur.execute("""
+        SELECT DISTINCT ON (LOWER(name)) LOWER(name) AS name, id
+        FROM ingredients
+        WHERE chef_id = %s AND LOWER(name) = ANY(%s)
+    """, (chef_id, list(wanted)))
+    ing_ids = {row['name']: row['id'] for row in cur.fetchall()}
+    
+    missing = [ing for key, ing in wanted.items() if key not in ing_ids]
+    if missing:
+        rows = execute_values(cur, """
+            INSERT INTO ingredients (chef_id, name, unit, category)
+            VALUES %s
+            RETURNING id, name
+        """, [
+            (chef_id, ing.name, ing.unit, ing.category)
+            for ing in missing
+        ], fetch=True)
+        ing_ids.update({row['name'].lower(): row['id'] for row in rows})
+    
+    return ing_ids
+
+
+def _begin_bulk_load(cur):
+    """
+    Transaction-local settings for one-shot bulk loads.
+    Skips waiting on the WAL flush at COMMIT.
+    """
+    cur.execute("SET LOCAL synchronous_commit = OFF")
+
+
+def save_batch_recipes_bulk(chef_id: str, recipes: List[Dict], bulk_load: bool = False) -> List[str]:
+    """
+    Save many batch recipes in one transaction with a handful of multi-row INSERTs.
+    Each dict takes the same keys as save_batch_recipe's keyword arguments;
+    'ingredients' may hold Ingredient tuples or dicts.
+    Creates v1.0 for every recipe, like save_batch_recipe.
+    bulk_load=True relaxes durability for one-shot loads such as seeding.
+    Returns: recipe_ids (UUIDs) in input order
+    """
+    if not recipes:
+        return []
+    
+    conn = get_connection()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        
+        if bulk_load:
+            _begin_bulk_load(cur)
+        
+        names = _unique_recipe_names(cur, chef_id, [r['name'] for r in recipes], 'batch')
+        ingredient_lists = [_as_ingredients(r.get('ingredients')) for r in recipes]
+        
+        rows = execute_values(cur, """
+            INSERT INTO batch_recipes (
+                chef_id, name, description, yield_quantity, yield_unit,
+                prep_time_minutes, cook_time_minutes, temperature, temperature_unit,
+                equipment, instructions, notes, is_complete
+            ) VALUES %s
+            RETURNING id, name
+        """, [
+            (
+                chef_id, name, r.get('description'), r.get('yield_quantity'), r.get('yield_unit'),
+                r.get('prep_time_minutes'), r.get('cook_time_minutes'), r.get('temperature'),
+                r.get('temperature_unit', 'C'), r.get('equipment'), r.get('instructions'),
+                r.get('notes'), r.get('is_complete', False)
+            )
+            for name, r in zip(names, recipes)
+        ], fetch=True)
+        id_by_name = {row['name']: row['id'] for row in rows}
+        recipe_ids = [id_by_name[name] for name in names]
+        
+        ing_ids = _bulk_ingredient_ids(cur, chef_id, [ing for ings in ingredient_lists for ing in ings])
+        
+        link_rows = [
+            (
+                recipe_id, ing_ids[ing.name.lower()], ing.quantity, ing.unit,
+                ing.preparation_notes, ing.is_optional
+            )
+            for recipe_id, ings in zip(recipe_ids, ingredient_lists)
+            for ing in ings
+        ]
+        _copy_ingredient_rows(cur, 'batch_ingredients', [
+            'batch_recipe_id', 'ingredient_id', 'quantity', 'unit', 'preparation_notes', 'is_optional'
+        ], link_rows)
+        
+        # v1.0 snapshots for every recipe
+        version_rows = execute_values(cur, """
+            INSERT INTO batch_recipe_versions (
+                recipe_id, version_number, is_active, created_by,
+                change_summary, change_reason,
+                name, description, yield_quantity, yield_unit,
+                prep_time_minutes, cook_time_minutes,
+                storage_instructions, temperature, temperature_unit,
+                equipment, instructions, notes
+            ) VALUES %s
+            RETURNING id, recipe_id
+        """, [
+            (
+                recipe_id, 1.0, True, chef_id, "Initial recipe creation (v1.0)", None,
+                name, r.get('description'), r.get('yield_quantity'), r.get('yield_unit'),
+                r.get('prep_time_minutes'), r.get('cook_time_minutes'),
+                r.get('notes'), r.get('temperature'), r.get('temperature_unit', 'C'),
+                r.get('equipment'), r.get('instructions'), r.get('notes')
+            )
+            for recipe_id, name, r in zip(recipe_ids, names, recipes)
+        ], fetch=True)
+        version_ids = {row['recipe_id']: row['id'] for row in version_rows}
+        
+        version_ing_rows = [
+            (
+                version_ids[recipe_id], ing_ids[ing.name.lower()],
+                ing.quantity or 0, ing.unit or '',
+                ing.preparation_notes, ing.is_optional
+            )
+            for recipe_id, ings in zip(recipe_ids, ingredient_lists)
+            for ing in ings
+        ]
+        _copy_ingredient_rows(cur, 'batch_version_ingredients', [
+            'version_id', 'ingredient_id', 'quantity', 'unit', 'preparation_notes', 'is_optional'
+        ], version_ing_rows)
+        
+        conn.commit()
+        _invalidate_search_cache(chef_id)
+        print(f"✅ Saved {len(recipe_ids)} batch recipes")
+        
+        # Sync to Google Sheets (non-blocking, failures don't affect DB save)
+        if SHEETS_ENABLED:
+            for recipe_id, name, r, ings in zip(recipe_ids, names, recipes, ingredient_lists):
+                try:
+                    google_sheets.add_batch_recipe({
+                        'id': recipe_id,
+                        'chef_id': chef_id,
+                        'name': name,
+                        'description': r.get('description'),
+                        'yield_quantity': r.get('yield_quantity'),
+                        'yield_unit': r.get('yield_unit'),
+                        'instructions': r.get('instructions'),
+                        'storage_instructions': r.get('notes')
+                    }, [ing._asdict() for ing in ings])
+                except Exception as sheets_error:
+                    logger.warning(f"Google Sheets sync failed (DB save succeeded): {sheets_error}")
+        
+        return [str(recipe_id) for recipe_id in recipe_ids]
+        
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Error bulk saving batch recipes: {e}")
+        raise
+    finally:
+        cur.close()
+        return_connection(conn)
+
+
+def save_plate_recipes_bulk(chef_id: str, recipes: List[Dict], bulk_load: bool = False) -> List[str]:
+    """
+    Save many plate recipes in one transaction with a handful of multi-row INSERTs.
+    Each dict takes the same keys as save_plate_recipe's keyword arguments;
+    'ingredients' may hold Ingredient tuples or dicts.
+    Creates v1.0 for every recipe, like save_plate_recipe.
+    bulk_load=True relaxes durability for one-shot loads such as seeding.
+    Returns: recipe_ids (UUIDs) in input order
+    """
+    if not recipes:
+        return []
+    
+    conn = get_connection()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        
+        if bulk_load:
+            _begin_bulk_load(cur)
+        
+        names = _unique_recipe_names(cur, chef_id, [r['name'] for r in recipes], 'plate')
+        ingredient_lists = [_as_ingredients(r.get('ingredients')) for r in recipes]
+        
+        rows = execute_values(cur, """
+            INSERT INTO plate_recipes (
+                chef_id, name, description, serves, category, cuisine,
+                plating_instructions, garnish, presentation_notes,
+                prep_time_minutes, cook_time_minutes, difficulty, notes, is_complete
+            ) VALUES %s
+            RETURNING id, name
+        """, [
+            (
+                chef_id, name, r.get('description'), r.get('serves'), r.get('category'),
+                r.get('cuisine'), r.get('plating_instructions'), r.get('garnish'),
+                r.get('presentation_notes'), r.get('prep_time_minutes'),
+                r.get('cook_time_minutes'), r.get('difficulty'), r.get('notes'),
+                r.get('is_complete', False)
+            )
+            for name, r in zip(names, recipes)
+        ], fetch=True)
+        id_by_name = {row['name']: row['id'] for row in rows}
+        recipe_ids = [id_by_name[name] for name in names]
+        
+        # Link batch recipes if provided
+        batch_rows = []
+        for recipe_id, r in zip(recipe_ids, recipes):
+            for i, batch in enumerate(r.get('batch_recipes') or []):
+                batch_id = batch.get('batch_id') or _find_batch_recipe_by_name(cur, chef_id, batch.get('name'))
+                if batch_id:
+                    batch_rows.append((
+                        recipe_id, batch_id, batch.get('quantity'), batch.get('unit'),
+                        i + 1, batch.get('preparation_notes')
+                    ))
+        if batch_rows:
+            execute_values(cur, """
+                INSERT INTO plate_batches (
+                    plate_recipe_id, batch_recipe_id, quantity, unit, assembly_order, preparation_notes
+                ) VALUES %s
+            """, batch_rows)
+        
+        ing_ids = _bulk_ingredient_ids(cur, chef_id, [ing for ings in ingredient_lists for ing in ings])
+        
+        link_rows = [
+            (
+                recipe_id, ing_ids[ing.name.lower()], ing.quantity, ing.unit,
+                ing.preparation_notes, ing.is_garnish, ing.is_optional
+            )
+            for recipe_id, ings in zip(recipe_ids, ingredient_lists)
+            for ing in ings
+        ]
+        _copy_ingredient_rows(cur, 'plate_ingredients', [
+            'plate_recipe_id', 'ingredient_id', 'quantity', 'unit', 'preparation_notes', 'is_garnish', 'is_optional'
+        ], link_rows)
+        
+        # v1.0 snapshots for every recipe
+        version_rows = execute_values(cur, """
+            INSERT INTO plate_recipe_versions (
+                recipe_id, version_number, is_active, created_by,
+                change_summary, change_reason,
+                name, description, serves, category, cuisine,
+                plating_instructions, garnish, presentation_notes,
+                prep_time_minutes, cook_time_minutes, difficulty, notes
+            ) VALUES %s
+            RETURNING id, recipe_id
+        """, [
+            (
+                recipe_id, 1.0, True, chef_id, "Initial recipe creation (v1.0)", None,
+                name, r.get('description'), r.get('serves'), r.get('category'),
+                r.get('cuisine'), r.get('plating_instructions'), r.get('garnish'),
+                r.get('presentation_notes'), r.get('prep_time_minutes'),
+                r.get('cook_time_minutes'), r.get('difficulty'), r.get('notes')
+            )
+            for recipe_id, name, r in zip(recipe_ids, names, recipes)
+        ], fetch=True)
+        version_ids = {row['recipe_id']: row['id'] for row in version_rows}
+        
+        version_ing_rows = [
+            (
+                version_ids[recipe_id], ing_ids[ing.name.lower()],
+                ing.quantity or 0, ing.unit or '',
+                ing.preparation_notes, ing.is_garnish, ing.is_optional
+            )
+            for recipe_id, ings in zip(recipe_ids, ingredient_lists)
+            for ing in ings
+        ]
+        _copy_ingredient_rows(cur, 'plate_version_ingredients', [
+            'version_id', 'ingredient_id', 'quantity', 'unit',
+            'preparation_notes', 'is_garnish', 'is_optional'
+        ], version_ing_rows)
+        
+        conn.commit()
+        _invalidate_search_cache(chef_id)
+        print(f"✅ Saved {len(recipe_ids)} plate recipes")
+        
+        # Sync to Google Sheets (non-blocking, failures don't affect DB save)
+        if SHEETS_ENABLED:
+            for recipe_id, name, r, ings in zip(recipe_ids, names, recipes, ingredient_lists):
+                try:
+                    google_sheets.add_plate_recipe({
+                        'id': recipe_id,
+                        'chef_id': chef_id,
+                        'name': name,
+                        'description': r.get('description'),
+                        'serves': r.get('serves'),
+                        'category': r.get('category'),
+                        'cuisine': r.get('cuisine'),
+                        'plating_instructions': r.get('plating_instructions')
+                    }, [ing._asdict() for ing in ings])
+                except Exception as sheets_error:
+                    logger.warning(f"Google Sheets sync failed (DB save succeeded): {sheets_error}")
+        
+        return [str(recipe_id) for recipe_id in recipe_ids]
+        
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Error bulk saving plate recipes: {e}")
+        raise
+    finally:
+        cur.close()
+        return_connection(conn)
+
+
 # ==================== RECIPE UPDATE ====================
 
 def update_recipe(
@@ -746,7 +1124,8 @@ def update_recipe(
 ) -> Dict[str, Any]:
     """
     Update an existing recipe's fields.
-    Returns: {"success": True/False, "message": str, "recipe_id": str}
+    Returns: {"success": True/False, "message": str, "recipe_id": str,
+              "new_version": float or None (version snapshot created, plate recipes only)}
     """
     conn = get_connection()
     try:
@@ -823,9 +1202,11 @@ def update_recipe(
             """, params)
         
         conn.commit()
+        _invalidate_search_cache(chef_id)
         
         # ==================== CREATE NEW VERSION ====================
         # After successful update, create new version snapshot
+        new_version = None  # Reported back to the caller, saves a re-read of the versions table
         try:
             # Step 1: Get OLD recipe state (from last active version)
             if recipe_type == "plate":
@@ -913,6 +1294,7 @@ def update_recipe(
                     )
                     
                     conn.commit()
+                    new_version = next_version
                     logger.info(f"Created version {next_version} for plate recipe '{new_data['name']}' (was v{current_version})")
                     logger.info(f"Changes: {change_info['summary']}")
                     
@@ -951,6 +1333,7 @@ def update_recipe(
                     )
                     
                     conn.commit()
+                    new_version = 1.0
                     logger.info(f"Created retroactive version 1.0 for '{recipe_data['name']}'")
             
             # TODO: Add batch recipe versioning (similar logic)
@@ -1002,7 +1385,8 @@ def update_recipe(
             "success": True,
             "message": message,
             "recipe_id": str(recipe_id),
-            "new_name": new_name or old_name
+            "new_name": new_name or old_name,
+            "new_version": new_version
         }
         
     except Exception as e:
@@ -1031,17 +1415,18 @@ def delete_recipe(
     try:
         cur = conn.cursor(cursor_factory=RealDictCursor)
         
-        # Find the recipe first
-        if recipe_type == "plate":
-            cur.execute("""
-                SELECT id, name FROM plate_recipes 
-                WHERE chef_id = %s AND LOWER(name) = LOWER(%s)
-            """, (chef_id, recipe_name))
-        else:
-            cur.execute("""
-                SELECT id, name FROM batch_recipes 
+        # Find and delete the recipe in one statement - versions, ingredient links
+        # and version ingredients go with it via ON DELETE CASCADE
+        table = 'plate_recipes' if recipe_type == "plate" else 'batch_recipes'
+        cur.execute(f"""
+            DELETE FROM {table}
+            WHERE id = (
+                SELECT id FROM {table}
                 WHERE chef_id = %s AND LOWER(name) = LOWER(%s)
-            """, (chef_id, recipe_name))
+                LIMIT 1
+            )
+            RETURNING id, name
+        """, (chef_id, recipe_name))
         
         recipe = cur.fetchone()
         
@@ -1054,13 +1439,8 @@ def delete_recipe(
         recipe_id = recipe['id']
         actual_name = recipe['name']
         
-        # Delete the recipe
-        if recipe_type == "plate":
-            cur.execute("DELETE FROM plate_recipes WHERE id = %s", (recipe_id,))
-        else:
-            cur.execute("DELETE FROM batch_recipes WHERE id = %s", (recipe_id,))
-        
         conn.commit()
+        _invalidate_search_cache(chef_id)
         print(f"✅ Deleted {recipe_type} recipe: {actual_name}")
         
         # Sync deletion to Google Sheets
@@ -1161,7 +1541,50 @@ def get_recipe_by_name(chef_id: str, name: str, recipe_type: Optional[str] = Non
         return_connection(conn)
 
 
+# Search results cache: (chef_id, normalized query) -> (expires_at, results)
+# Voice sessions repeat the same lookups; any save/update/delete for a chef clears its entries.
+SEARCH_CACHE_TTL = 60
+SEARCH_CACHE_MAXSIZE = 1024
+_search_cache: Dict[tuple, tuple] = {}
+_search_cache_lock = threading.Lock()  # Shared by to_thread workers and Flask threads
+_search_generation: Dict[str, int] = {}  # Bumped per chef on invalidation
+
+def _invalidate_search_cache(chef_id: str):
+    """Drop cached search results for a chef after their recipes change"""
+    with _search_cache_lock:
+        _search_generation[chef_id] = _search_generation.get(chef_id, 0) + 1
+        for key in [k for k in _search_cache if k[0] == chef_id]:
+            del _search_cache[key]
+
 def smart_search_recipes(chef_id: str, query: str) -> Dict:
+    """
+    Cached front for _smart_search_recipes.
+    Results are reused for SEARCH_CACHE_TTL seconds per (chef_id, query);
+    callers get their own copy, so mutating a result can't corrupt the cache.
+    """
+    query = query or ''
+    key = (chef_id, query.strip().lower())
+    now = time.monotonic()
+    
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        generation = _search_generation.get(chef_id, 0)
+    if cached and cached[0] > now:
+        return copy.deepcopy(cached[1])
+    
+    # Query runs outside the lock so slow searches don't serialize other threads
+    results = _smart_search_recipes(chef_id, query)
+    
+    with _search_cache_lock:
+        # Skip storing if a write for this chef landed while the query ran
+        if _search_generation.get(chef_id, 0) == generation:
+            if key not in _search_cache and len(_search_cache) >= SEARCH_CACHE_MAXSIZE:
+                del _search_cache[next(iter(_search_cache))]  # Evict oldest entry
+            _search_cache[key] = (now + SEARCH_CACHE_TTL, results)
+    
+    return copy.deepcopy(results)
+
+def _smart_search_recipes(chef_id: str, query: str) -> Dict:
     """
     Smart search with PRIORITY:
     1. EXACT match (highest priority)
@@ -1338,6 +1761,73 @@ def smart_search_recipes(chef_id: str, query: str) -> Dict:
 
 
 
+def export_all_for_sheets() -> Dict[str, List[Dict]]:
+    """
+    Export every plate recipe, batch recipe and ingredient for a full Google Sheets sync.
+    One round-trip: recipes come back with their ingredients nested via json_agg.
+    
+    Returns:
+        {'plates': [...], 'batches': [...], 'ingredients': [...]}
+    """
+    conn = get_connection()
+    try:
+        cur = conn.cursor()
+        
+        cur.execute("""
+            SELECT json_build_object(
+                'plates', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'id', pr.id, 'chef_id', pr.chef_id, 'name', pr.name,
+                        'description', pr.description, 'serves', pr.serves,
+                        'category', pr.category, 'cuisine', pr.cuisine,
+                        'plating_instructions', pr.plating_instructions,
+                        'ingredients', COALESCE((
+                            SELECT json_agg(json_build_object(
+                                'name', i.name, 'quantity', pi.quantity, 'unit', pi.unit
+                            ))
+                            FROM plate_ingredients pi
+                            JOIN ingredients i ON i.id = pi.ingredient_id
+                            WHERE pi.plate_recipe_id = pr.id
+                        ), '[]'::json)
+                    ) ORDER BY pr.created_at DESC)
+                    FROM plate_recipes pr
+                ), '[]'::json),
+                'batches', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'id', br.id, 'chef_id', br.chef_id, 'name', br.name,
+                        'description', br.description,
+                        'yield_quantity', br.yield_quantity, 'yield_unit', br.yield_unit,
+                        'instructions', br.instructions,
+                        'storage_instructions', br.storage_instructions,
+                        'ingredients', COALESCE((
+                            SELECT json_agg(json_build_object(
+                                'name', i.name, 'quantity', bi.quantity, 'unit', bi.unit
+                            ))
+                            FROM batch_ingredients bi
+                            JOIN ingredients i ON i.id = bi.ingredient_id
+                            WHERE bi.batch_recipe_id = br.id
+                        ), '[]'::json)
+                    ) ORDER BY br.created_at DESC)
+                    FROM batch_recipes br
+                ), '[]'::json),
+                'ingredients', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'id', id, 'name', name, 'chef_id', chef_id,
+                        'unit', unit, 'category', category
+                    ) ORDER BY created_at DESC)
+                    FROM ingredients
+                ), '[]'::json)
+            )
+        """)
+        
+        # psycopg2 decodes json columns to Python objects
+        return cur.fetchone()[0]
+        
+    finally:
+        cur.close()
+        return_connection(conn)
+
+
 def list_chef_recipes(chef_id: str, limit: int = 50) -> Dict[str, List]:
     """Get all recipes for a chef"""
     conn = get_connection()
@@ -1375,6 +1865,16 @@ def list_chef_recipes(chef_id: str, limit: int = 50) -> Dict[str, List]:
 
 # ==================== CONVERSATIONS ====================
 
+def _dumps_jsonb(obj) -> str:
+    """
+    Encode conversation state with orjson, tolerating what json.dumps(default=str) did:
+    non-str dict keys and Decimal/datetime etc. in tool results.
+    """
+    try:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(obj, default=str)
+
 def save_conversation(chef_id: str, session_id: str, context: Dict, messages: List[Dict]) -> None:
     """Save or update conversation state"""
     conn = get_connection()
@@ -1388,7 +1888,7 @@ def save_conversation(chef_id: str, session_id: str, context: Dict, messages: Li
             SET current_context = EXCLUDED.current_context,
                 message_history = EXCLUDED.message_history,
                 updated_at = NOW()
-        """, (chef_id, session_id, json.dumps(context), json.dumps(messages)))
+        """, (chef_id, session_id, _dumps_jsonb(context), _dumps_jsonb(messages)))
         
         conn.commit()
         
@@ -1437,6 +1937,27 @@ def _get_or_create_ingredient(cur, chef_id: str, name: str, unit: Optional[str],
     
     return cur.fetchone()['id']
 
+def _copy_ingredient_rows(cur, table: str, columns: List[str], rows: List[tuple]):
+    """
+    Load ingredient link rows with a single COPY FROM STDIN instead of one INSERT per row.
+    Runs on the caller's cursor, so it shares the caller's transaction.
+    None is sent as \\N (the COPY NULL marker) so '' stays an empty string -
+    csv.writer writes both as an empty field, which COPY's CSV default reads as NULL.
+    """
+    if not rows:
+        return
+    
+    buf = io.StringIO()
+    csv.writer(buf, delimiter='\t', lineterminator='\n').writerows(
+        tuple(r'\N' if value is None else value for value in row) for row in rows
+    )
+    buf.seek(0)
+    
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')",
+        buf
+    )
+
 def _find_batch_recipe_by_name(cur, chef_id: str, name: str) -> Optional[str]:
     """Find batch recipe ID by name"""
     cur.execute("""
@@ -0,0 +1,11 @@
+"""
+Environment Settings
+Parses .env once per process; scripts and modules import the values from here
+"""
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_URL = os.getenv('DATABASE_URL')
+SHEETS_ID = os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID')
@@ -3,6 +3,7 @@ Google Sheets Integration for Chef Voice AI Agent
 Handles real-time syncing of recipes to Google Sheets
 """
 
+import functools
 import os
 import logging
 from datetime import datetime
@@ -42,11 +43,66 @@ INGREDIENT_HEADERS = [
 ]
 
 
+def _ingredients_str(ingredients: Optional[List[Dict[str, Any]]]) -> str:
+    """Format ingredients as a comma-separated string"""
+    if not ingredients:
+        return ""
+    return ", ".join(
+        f"{ing.get('name', '')} ({ing.get('quantity', '')} {ing.get('unit', '')})"
+        for ing in ingredients
+    )
+
+
+def _plate_row(recipe: Dict[str, Any], ingredients: Optional[List[Dict[str, Any]]], created_at: str) -> List:
+    """Row for the Plate Recipes tab (PLATE_HEADERS order)"""
+    return [
+        str(recipe.get('id', '')),
+        recipe.get('name', ''),
+        recipe.get('chef_id', ''),
+        recipe.get('description', ''),
+        str(recipe.get('serves', '')),
+        recipe.get('category', ''),
+        recipe.get('cuisine', ''),
+        _ingredients_str(ingredients),
+        recipe.get('plating_instructions', ''),
+        created_at
+    ]
+
+
+def _batch_row(recipe: Dict[str, Any], ingredients: Optional[List[Dict[str, Any]]], created_at: str) -> List:
+    """Row for the Batch Recipes tab (BATCH_HEADERS order)"""
+    return [
+        str(recipe.get('id', '')),
+        recipe.get('name', ''),
+        recipe.get('chef_id', ''),
+        recipe.get('description', ''),
+        str(recipe.get('yield_quantity', '')),
+        recipe.get('yield_unit', ''),
+        _ingredients_str(ingredients),
+        recipe.get('instructions', ''),
+        recipe.get('storage_instructions', ''),
+        created_at
+    ]
+
+
+def _ingredient_row(ingredient: Dict[str, Any], created_at: str) -> List:
+    """Row for the Ingredients tab (INGREDIENT_HEADERS order)"""
+    return [
+        str(ingredient.get('id', '')),
+        ingredient.get('name', ''),
+        ingredient.get('chef_id', ''),
+        ingredient.get('unit', ''),
+        ingredient.get('category', ''),
+        created_at
+    ]
+
+
 class GoogleSheetsClient:
     """Client for Google Sheets operations"""
     
     def __init__(self):
         self.client: Optional[gspread.Client] = None
+        self.credentials: Optional[Credentials] = None
         self.spreadsheet: Optional[gspread.Spreadsheet] = None
         self.initialized = False
         
@@ -96,6 +152,7 @@ class GoogleSheetsClient:
                 )
                 logger.info(f"📄 Using credentials from file: {creds_path}")
             
+            self.credentials = credentials
             self.client = gspread.authorize(credentials)
             self.spreadsheet = self.client.open_by_key(spreadsheet_id)
             
@@ -144,27 +201,7 @@ class GoogleSheetsClient:
         
         try:
             ws = self.spreadsheet.worksheet(PLATE_RECIPES_TAB)
-            
-            # Format ingredients as comma-separated string
-            ing_str = ""
-            if ingredients:
-                ing_names = [f"{ing.get('name', '')} ({ing.get('quantity', '')} {ing.get('unit', '')})" 
-                            for ing in ingredients]
-                ing_str = ", ".join(ing_names)
-            
-            # Prepare row data
-            row = [
-                str(recipe.get('id', '')),
-                recipe.get('name', ''),
-                recipe.get('chef_id', ''),
-                recipe.get('description', ''),
-                str(recipe.get('serves', '')),
-                recipe.get('category', ''),
-                recipe.get('cuisine', ''),
-                ing_str,
-                recipe.get('plating_instructions', ''),
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
+            row = _plate_row(recipe, ingredients, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
             
             ws.append_row(row, value_input_option='USER_ENTERED')
             logger.info(f"📊 Synced plate recipe to Sheets: {recipe.get('name')}")
@@ -182,27 +219,7 @@ class GoogleSheetsClient:
         
         try:
             ws = self.spreadsheet.worksheet(BATCH_RECIPES_TAB)
-            
-            # Format ingredients as comma-separated string
-            ing_str = ""
-            if ingredients:
-                ing_names = [f"{ing.get('name', '')} ({ing.get('quantity', '')} {ing.get('unit', '')})" 
-                            for ing in ingredients]
-                ing_str = ", ".join(ing_names)
-            
-            # Prepare row data
-            row = [
-                str(recipe.get('id', '')),
-                recipe.get('name', ''),
-                recipe.get('chef_id', ''),
-                recipe.get('description', ''),
-                str(recipe.get('yield_quantity', '')),
-                recipe.get('yield_unit', ''),
-                ing_str,
-                recipe.get('instructions', ''),
-                recipe.get('storage_instructions', ''),
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
+            row = _batch_row(recipe, ingredients, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
             
             ws.append_row(row, value_input_option='USER_ENTERED')
             logger.info(f"📊 Synced batch recipe to Sheets: {recipe.get('name')}")
@@ -220,15 +237,7 @@ class GoogleSheetsClient:
         
         try:
             ws = self.spreadsheet.worksheet(INGREDIENTS_TAB)
-            
-            row = [
-                str(ingredient.get('id', '')),
-                ingredient.get('name', ''),
-                ingredient.get('chef_id', ''),
-                ingredient.get('unit', ''),
-                ingredient.get('category', ''),
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
+            row = _ingredient_row(ingredient, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
             
             ws.append_row(row, value_input_option='USER_ENTERED')
             logger.info(f"📊 Synced ingredient to Sheets: {ingredient.get('name')}")
@@ -318,97 +327,36 @@ class GoogleSheetsClient:
             return {"error": "Not initialized"}
         
         try:
-            stats = {"plate_recipes": 0, "batch_recipes": 0, "ingredients": 0}
-            
-            # Clear existing data (keep headers)
-            for tab_name in [PLATE_RECIPES_TAB, BATCH_RECIPES_TAB, INGREDIENTS_TAB]:
-                try:
-                    ws = self.spreadsheet.worksheet(tab_name)
-                    # Get all values to count rows
-                    all_values = ws.get_all_values()
-                    if len(all_values) > 1:
-                        # Clear all except header row
-                        ws.delete_rows(2, len(all_values))
-                except:
-                    pass
-            
-            # Get connection from database module
-            from database import get_connection, return_connection
-            from psycopg2.extras import RealDictCursor
+            # One query returns every recipe (with nested ingredients) and ingredient
+            if db_module is None:
+                import database as db_module
+            export = db_module.export_all_for_sheets()
+            
+            created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            tab_rows = {
+                PLATE_RECIPES_TAB: [_plate_row(r, r.get('ingredients'), created_at) for r in export['plates']],
+                BATCH_RECIPES_TAB: [_batch_row(r, r.get('ingredients'), created_at) for r in export['batches']],
+                INGREDIENTS_TAB: [_ingredient_row(i, created_at) for i in export['ingredients']],
+            }
+            
+            # Clear existing data (keep headers) in one call
+            self.spreadsheet.values_batch_clear(
+                body={"ranges": [f"'{tab_name}'!A2:Z" for tab_name in tab_rows]}
+            )
+            
+            # Write all three tabs in one call
+            data = [
+                {"range": f"'{tab_name}'!A2", "values": rows}
+                for tab_name, rows in tab_rows.items() if rows
+            ]
+            if data:
+                self.spreadsheet.values_batch_update(body={"valueInputOption": "USER_ENTERED", "data": data})
             
-            conn = get_connection()
-            if not conn:
-                return {"error": "Database not connected"}
-            
-            try:
-                cur = conn.cursor(cursor_factory=RealDictCursor)
-                
-                # Sync plate recipes
-                cur.execute("""
-                    SELECT pr.id, pr.chef_id, pr.name, pr.description, pr.serves,
-                           pr.category, pr.cuisine, pr.plating_instructions, pr.created_at
-                    FROM plate_recipes pr
-                    ORDER BY pr.created_at DESC
-                """)
-                plate_recipes = cur.fetchall()
-                
-                for recipe in plate_recipes:
-                    # Get ingredients for this recipe
-                    cur.execute("""
-                        SELECT i.name, pi.quantity, pi.unit
-                        FROM plate_ingredients pi
-                        JOIN ingredients i ON i.id = pi.ingredient_id
-                        WHERE pi.plate_recipe_id = %s
-                    """, (recipe['id'],))
-                    ingredients = cur.fetchall()
-                    
-                    recipe_dict = dict(recipe)
-                    ingredients_list = [dict(ing) for ing in ingredients]
-                    
-                    if self.add_plate_recipe(recipe_dict, ingredients_list):
-                        stats["plate_recipes"] += 1
-                
-                # Sync batch recipes
-                cur.execute("""
-                    SELECT br.id, br.chef_id, br.name, br.description,
-                           br.yield_quantity, br.yield_unit, br.instructions,
-                           br.storage_instructions, br.created_at
-                    FROM batch_recipes br
-                    ORDER BY br.created_at DESC
-                """)
-                batch_recipes = cur.fetchall()
-                
-                for recipe in batch_recipes:
-                    # Get ingredients for this recipe
-                    cur.execute("""
-                        SELECT i.name, bi.quantity, bi.unit
-                        FROM batch_ingredients bi
-                        JOIN ingredients i ON i.id = bi.ingredient_id
-                        WHERE bi.batch_recipe_id = %s
-                    """, (recipe['id'],))
-                    ingredients = cur.fetchall()
-                    
-                    recipe_dict = dict(recipe)
-                    ingredients_list = [dict(ing) for ing in ingredients]
-                    
-                    if self.add_batch_recipe(recipe_dict, ingredients_list):
-                        stats["batch_recipes"] += 1
-                
-                # Sync ingredients
-                cur.execute("""
-                    SELECT id, name, chef_id, unit, category, created_at
-                    FROM ingredients
-                    ORDER BY created_at DESC
-                """)
-                ingredients = cur.fetchall()
-                
-                for ing in ingredients:
-                    if self.add_ingredient(dict(ing)):
-                        stats["ingredients"] += 1
-                
-                cur.close()
-            finally:
-                return_connection(conn)
+            stats = {
+                "plate_recipes": len(tab_rows[PLATE_RECIPES_TAB]),
+                "batch_recipes": len(tab_rows[BATCH_RECIPES_TAB]),
+                "ingredients": len(tab_rows[INGREDIENTS_TAB]),
+            }
             
             logger.info(f"✅ Full sync complete: {stats}")
             return stats
@@ -457,6 +405,16 @@ def delete_recipe(recipe_id: str, recipe_type: str) -> bool:
     return sheets_client.delete_recipe(recipe_id, recipe_type)
 
 
+@functools.cache
+def get_service():
+    """Raw Sheets v4 API service (values.get/batchGet), built once per process"""
+    from googleapiclient.discovery import build
+    
+    if not sheets_client.initialized and not sheets_client.init():
+        raise RuntimeError("Google Sheets not configured")
+    return build('sheets', 'v4', credentials=sheets_client.credentials, cache_discovery=False)
+
+
 def test_connection():
     """Test the Google Sheets connection"""
     print("Testing Google Sheets connection...")
@@ -0,0 +1,27 @@
+"""
+Identity Generation Module
+Random chef/participant identities for anonymous sessions
+"""
+
+import secrets
+from collections import deque
+
+# Suffixes are cut from one large random block, so the hot path is a deque pop
+# instead of a getrandom() syscall per connection
+_SUFFIX_HEX_CHARS = 8
+_BLOCK_SIZE = 1024
+
+_suffix_pool = deque()
+
+
+def new_chef_identity() -> str:
+    """Return a fresh identity like 'chef-1a2b3c4d'"""
+    try:
+        suffix = _suffix_pool.popleft()
+    except IndexError:
+        block = secrets.token_hex(_SUFFIX_HEX_CHARS // 2 * _BLOCK_SIZE)
+        _suffix_pool.extend(
+            block[i:i + _SUFFIX_HEX_CHARS] for i in range(0, len(block), _SUFFIX_HEX_CHARS)
+        )
+        suffix = _suffix_pool.popleft()
+    return f"chef-{suffix}"
@@ -26,7 +26,7 @@ except ImportError:
 
 import database as db
 import google_sheets
-from prompts import SYSTEM_PROMPT
+from prompts import FULL_SYSTEM_PROMPT
 
 # Load environment
 load_dotenv()
@@ -103,7 +103,7 @@ class ChefAssistant(Agent):
     """Chef AI Voice Assistant with function tools for recipe operations"""
     
     def __init__(self, chef_id: str):
-        super().__init__(instructions=SYSTEM_PROMPT)
+        super().__init__(instructions=FULL_SYSTEM_PROMPT)
         self.chef_id = chef_id
         self._room = None  # Will be set by session
         
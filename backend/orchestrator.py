@@ -15,7 +15,7 @@ import asyncio
 from groq import Groq, RateLimitError, APIError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from prompts import SYSTEM_PROMPT, OFF_TOPIC_RESPONSE
+from prompts import FULL_SYSTEM_PROMPT, OFF_TOPIC_RESPONSE
 import database as db
 
 logger = logging.getLogger(__name__)
@@ -180,7 +180,7 @@ class ConversationOrchestrator:
         
         # Conversation history for context
         self.messages = [
-            {"role": "system", "content": SYSTEM_PROMPT}
+            {"role": "system", "content": FULL_SYSTEM_PROMPT}
         ]
         
         # Current recipe being built
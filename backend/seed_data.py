@@ -8,213 +8,200 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv()
-
-import database as db
+import database as db  # Loads .env via env.py
+from database import Ingredient
 
 # Chef ID for test data - MUST match what agent uses!
 # In console mode, the agent uses "mock_user" as the participant identity
 TEST_CHEF_ID = "mock_user"
 
+# ========== BATCH RECIPES ==========
 
-
-def seed_data():
-    """Insert dummy data for testing"""
-    
-    print("🌱 Seeding database with test data...")
-    print("=" * 60)
-    
-    # ========== BATCH RECIPES ==========
-    
+BATCH_RECIPES = [
     # 1. Tomato Sauce Base
-    print("\n📦 Creating Batch Recipes...")
-    
-    tomato_sauce_id = db.save_batch_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Tomato Sauce Base",
-        description="Classic Italian tomato sauce for pasta and pizza",
-        yield_quantity=5,
-        yield_unit="liters",
-        prep_time_minutes=15,
-        cook_time_minutes=60,
-        temperature=90,
-        temperature_unit="C",
-        equipment=["Large pot", "Wooden spoon", "Blender"],
-        instructions="Saute garlic and onions. Add tomatoes. Simmer for 1 hour. Blend until smooth.",
-        ingredients=[
-            {"name": "Roma Tomatoes", "quantity": 3, "unit": "kg", "preparation_notes": "roughly chopped"},
-            {"name": "Garlic", "quantity": 50, "unit": "grams", "preparation_notes": "minced"},
-            {"name": "Onions", "quantity": 500, "unit": "grams", "preparation_notes": "diced"},
-            {"name": "Olive Oil", "quantity": 100, "unit": "ml"},
-            {"name": "Salt", "quantity": 30, "unit": "grams"},
-            {"name": "Basil", "quantity": 50, "unit": "grams", "preparation_notes": "fresh, chopped"},
+    {
+        "name": "Tomato Sauce Base",
+        "description": "Classic Italian tomato sauce for pasta and pizza",
+        "yield_quantity": 5,
+        "yield_unit": "liters",
+        "prep_time_minutes": 15,
+        "cook_time_minutes": 60,
+        "temperature": 90,
+        "temperature_unit": "C",
+        "equipment": ["Large pot", "Wooden spoon", "Blender"],
+        "instructions": "Saute garlic and onions. Add tomatoes. Simmer for 1 hour. Blend until smooth.",
+        "ingredients": [
+            Ingredient("Roma Tomatoes", 3, "kg", "roughly chopped"),
+            Ingredient("Garlic", 50, "grams", "minced"),
+            Ingredient("Onions", 500, "grams", "diced"),
+            Ingredient("Olive Oil", 100, "ml"),
+            Ingredient("Salt", 30, "grams"),
+            Ingredient("Basil", 50, "grams", "fresh, chopped"),
         ],
-        notes="Can be stored refrigerated for 1 week or frozen for 3 months",
-        is_complete=True
-    )
-    print(f"  ✅ Tomato Sauce Base (ID: {tomato_sauce_id})")
-    
+        "notes": "Can be stored refrigerated for 1 week or frozen for 3 months",
+        "is_complete": True
+    },
     # 2. Chicken Stock
-    chicken_stock_id = db.save_batch_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Chicken Stock",
-        description="Rich homemade chicken stock for soups and sauces",
-        yield_quantity=10,
-        yield_unit="liters",
-        prep_time_minutes=20,
-        cook_time_minutes=180,
-        temperature=85,
-        temperature_unit="C",
-        equipment=["Stock pot", "Strainer", "Ladle"],
-        instructions="Roast bones. Add vegetables and water. Simmer 3 hours. Strain and cool.",
-        ingredients=[
-            {"name": "Chicken Bones", "quantity": 3, "unit": "kg"},
-            {"name": "Carrots", "quantity": 500, "unit": "grams", "preparation_notes": "roughly chopped"},
-            {"name": "Celery", "quantity": 300, "unit": "grams", "preparation_notes": "roughly chopped"},
-            {"name": "Onions", "quantity": 400, "unit": "grams", "preparation_notes": "quartered"},
-            {"name": "Bay Leaves", "quantity": 5, "unit": "pieces"},
-            {"name": "Black Peppercorns", "quantity": 10, "unit": "grams"},
-            {"name": "Water", "quantity": 12, "unit": "liters"},
+    {
+        "name": "Chicken Stock",
+        "description": "Rich homemade chicken stock for soups and sauces",
+        "yield_quantity": 10,
+        "yield_unit": "liters",
+        "prep_time_minutes": 20,
+        "cook_time_minutes": 180,
+        "temperature": 85,
+        "temperature_unit": "C",
+        "equipment": ["Stock pot", "Strainer", "Ladle"],
+        "instructions": "Roast bones. Add vegetables and water. Simmer 3 hours. Strain and cool.",
+        "ingredients": [
+            Ingredient("Chicken Bones", 3, "kg"),
+            Ingredient("Carrots", 500, "grams", "roughly chopped"),
+            Ingredient("Celery", 300, "grams", "roughly chopped"),
+            Ingredient("Onions", 400, "grams", "quartered"),
+            Ingredient("Bay Leaves", 5, "pieces"),
+            Ingredient("Black Peppercorns", 10, "grams"),
+            Ingredient("Water", 12, "liters"),
         ],
-        notes="Reduce by half for demi-glace",
-        is_complete=True
-    )
-    print(f"  ✅ Chicken Stock (ID: {chicken_stock_id})")
-    
+        "notes": "Reduce by half for demi-glace",
+        "is_complete": True
+    },
     # 3. Raita
-    raita_id = db.save_batch_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Raita",
-        description="Cool yogurt-based Indian condiment",
-        yield_quantity=2,
-        yield_unit="liters",
-        prep_time_minutes=10,
-        cook_time_minutes=0,
-        ingredients=[
-            {"name": "Yogurt", "quantity": 1.5, "unit": "kg", "preparation_notes": "whisked smooth"},
-            {"name": "Cucumber", "quantity": 300, "unit": "grams", "preparation_notes": "grated and squeezed"},
-            {"name": "Cumin Powder", "quantity": 10, "unit": "grams", "preparation_notes": "roasted"},
-            {"name": "Salt", "quantity": 15, "unit": "grams"},
-            {"name": "Mint", "quantity": 30, "unit": "grams", "preparation_notes": "finely chopped"},
+    {
+        "name": "Raita",
+        "description": "Cool yogurt-based Indian condiment",
+        "yield_quantity": 2,
+        "yield_unit": "liters",
+        "prep_time_minutes": 10,
+        "cook_time_minutes": 0,
+        "ingredients": [
+            Ingredient("Yogurt", 1.5, "kg", "whisked smooth"),
+            Ingredient("Cucumber", 300, "grams", "grated and squeezed"),
+            Ingredient("Cumin Powder", 10, "grams", "roasted"),
+            Ingredient("Salt", 15, "grams"),
+            Ingredient("Mint", 30, "grams", "finely chopped"),
         ],
-        notes="Serve chilled. Best made fresh.",
-        is_complete=True
-    )
-    print(f"  ✅ Raita (ID: {raita_id})")
-    
+        "notes": "Serve chilled. Best made fresh.",
+        "is_complete": True
+    },
     # 4. Biryani Rice (partially complete)
-    biryani_rice_id = db.save_batch_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Biryani Rice Layer",
-        description="Saffron-infused basmati rice for layered biryani",
-        yield_quantity=5,
-        yield_unit="kg",
-        prep_time_minutes=30,
-        cook_time_minutes=20,
-        temperature=100,
-        temperature_unit="C",
-        ingredients=[
-            {"name": "Basmati Rice", "quantity": 3, "unit": "kg", "preparation_notes": "soaked 30 mins"},
-            {"name": "Saffron", "quantity": 2, "unit": "grams", "preparation_notes": "dissolved in warm milk"},
-            {"name": "Ghee", "quantity": 200, "unit": "grams"},
-            {"name": "Whole Spices", "quantity": 50, "unit": "grams", "preparation_notes": "cardamom, cloves, cinnamon"},
-            {"name": "Salt", "quantity": 40, "unit": "grams"},
+    {
+        "name": "Biryani Rice Layer",
+        "description": "Saffron-infused basmati rice for layered biryani",
+        "yield_quantity": 5,
+        "yield_unit": "kg",
+        "prep_time_minutes": 30,
+        "cook_time_minutes": 20,
+        "temperature": 100,
+        "temperature_unit": "C",
+        "ingredients": [
+            Ingredient("Basmati Rice", 3, "kg", "soaked 30 mins"),
+            Ingredient("Saffron", 2, "grams", "dissolved in warm milk"),
+            Ingredient("Ghee", 200, "grams"),
+            Ingredient("Whole Spices", 50, "grams", "cardamom, cloves, cinnamon"),
+            Ingredient("Salt", 40, "grams"),
         ],
-        notes="Rice should be 70% cooked before layering",
-        is_complete=True
-    )
-    print(f"  ✅ Biryani Rice Layer (ID: {biryani_rice_id})")
-    
-    # ========== PLATE RECIPES ==========
-    
-    print("\n🍽️ Creating Plate Recipes...")
-    
+        "notes": "Rice should be 70% cooked before layering",
+        "is_complete": True
+    },
+]
+
+# ========== PLATE RECIPES ==========
+
+PLATE_RECIPES = [
     # 1. Chicken Biryani
-    biryani_id = db.save_plate_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Hyderabadi Chicken Biryani",
-        description="Aromatic layered rice dish with spiced chicken",
-        serves=10,
-        category="main",
-        cuisine="Indian",
-        plating_instructions="250g rice per plate, 100g chicken on top, drizzle of saffron ghee",
-        garnish="Fried onions, fresh mint, lemon wedge",
-        presentation_notes="Serve in copper handi or on a large platter. Rice should be fluffy with visible saffron strands.",
-        prep_time_minutes=45,
-        cook_time_minutes=60,
-        difficulty="hard",
-        ingredients=[
-            {"name": "Chicken", "quantity": 1, "unit": "kg", "preparation_notes": "cut into 8 pieces, marinated"},
-            {"name": "Fried Onions", "quantity": 100, "unit": "grams", "is_garnish": True},
-            {"name": "Mint Leaves", "quantity": 20, "unit": "grams", "is_garnish": True},
+    {
+        "name": "Hyderabadi Chicken Biryani",
+        "description": "Aromatic layered rice dish with spiced chicken",
+        "serves": 10,
+        "category": "main",
+        "cuisine": "Indian",
+        "plating_instructions": "250g rice per plate, 100g chicken on top, drizzle of saffron ghee",
+        "garnish": "Fried onions, fresh mint, lemon wedge",
+        "presentation_notes": "Serve in copper handi or on a large platter. Rice should be fluffy with visible saffron strands.",
+        "prep_time_minutes": 45,
+        "cook_time_minutes": 60,
+        "difficulty": "hard",
+        "ingredients": [
+            Ingredient("Chicken", 1, "kg", "cut into 8 pieces, marinated"),
+            Ingredient("Fried Onions", 100, "grams", is_garnish=True),
+            Ingredient("Mint Leaves", 20, "grams", is_garnish=True),
         ],
-        notes="Serve with raita on the side. Should be a bit spicier than usual.",
-        is_complete=True
-    )
-    print(f"  ✅ Hyderabadi Chicken Biryani (ID: {biryani_id})")
-    
+        "notes": "Serve with raita on the side. Should be a bit spicier than usual.",
+        "is_complete": True
+    },
     # 2. Spaghetti Marinara
-    marinara_id = db.save_plate_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Spaghetti Marinara",
-        description="Classic Italian pasta with tomato sauce",
-        serves=4,
-        category="main",
-        cuisine="Italian",
-        plating_instructions="Twirl 150g pasta in center of plate, ladle 100ml sauce on top",
-        garnish="Fresh basil leaves, grated parmesan",
-        presentation_notes="Use white plate for contrast. Basil should be bright green.",
-        prep_time_minutes=10,
-        cook_time_minutes=15,
-        difficulty="easy",
-        ingredients=[
-            {"name": "Spaghetti", "quantity": 600, "unit": "grams"},
-            {"name": "Parmesan", "quantity": 50, "unit": "grams", "preparation_notes": "freshly grated", "is_garnish": True},
-            {"name": "Basil", "quantity": 20, "unit": "grams", "is_garnish": True},
+    {
+        "name": "Spaghetti Marinara",
+        "description": "Classic Italian pasta with tomato sauce",
+        "serves": 4,
+        "category": "main",
+        "cuisine": "Italian",
+        "plating_instructions": "Twirl 150g pasta in center of plate, ladle 100ml sauce on top",
+        "garnish": "Fresh basil leaves, grated parmesan",
+        "presentation_notes": "Use white plate for contrast. Basil should be bright green.",
+        "prep_time_minutes": 10,
+        "cook_time_minutes": 15,
+        "difficulty": "easy",
+        "ingredients": [
+            Ingredient("Spaghetti", 600, "grams"),
+            Ingredient("Parmesan", 50, "grams", "freshly grated", is_garnish=True),
+            Ingredient("Basil", 20, "grams", is_garnish=True),
         ],
-        notes="Uses Tomato Sauce Base batch recipe",
-        is_complete=True
-    )
-    print(f"  ✅ Spaghetti Marinara (ID: {marinara_id})")
-    
+        "notes": "Uses Tomato Sauce Base batch recipe",
+        "is_complete": True
+    },
     # 3. Butter Chicken
-    butter_chicken_id = db.save_plate_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Butter Chicken",
-        description="Creamy tomato-based chicken curry",
-        serves=6,
-        category="main",
-        cuisine="Indian",
-        plating_instructions="200g curry in center, rice on side, naan on opposite side",
-        garnish="Fresh cream swirl, coriander leaves",
-        presentation_notes="Cream should form a decorative spiral on top",
-        prep_time_minutes=30,
-        cook_time_minutes=45,
-        difficulty="medium",
-        ingredients=[
-            {"name": "Chicken Breast", "quantity": 800, "unit": "grams", "preparation_notes": "cubed, marinated"},
-            {"name": "Heavy Cream", "quantity": 200, "unit": "ml"},
-            {"name": "Butter", "quantity": 100, "unit": "grams"},
-            {"name": "Kashmiri Chili", "quantity": 30, "unit": "grams"},
-            {"name": "Garam Masala", "quantity": 20, "unit": "grams"},
+    {
+        "name": "Butter Chicken",
+        "description": "Creamy tomato-based chicken curry",
+        "serves": 6,
+        "category": "main",
+        "cuisine": "Indian",
+        "plating_instructions": "200g curry in center, rice on side, naan on opposite side",
+        "garnish": "Fresh cream swirl, coriander leaves",
+        "presentation_notes": "Cream should form a decorative spiral on top",
+        "prep_time_minutes": 30,
+        "cook_time_minutes": 45,
+        "difficulty": "medium",
+        "ingredients": [
+            Ingredient("Chicken Breast", 800, "grams", "cubed, marinated"),
+            Ingredient("Heavy Cream", 200, "ml"),
+            Ingredient("Butter", 100, "grams"),
+            Ingredient("Kashmiri Chili", 30, "grams"),
+            Ingredient("Garam Masala", 20, "grams"),
         ],
-        notes="Can use Tomato Sauce Base as foundation",
-        is_complete=True
-    )
-    print(f"  ✅ Butter Chicken (ID: {butter_chicken_id})")
-    
+        "notes": "Can use Tomato Sauce Base as foundation",
+        "is_complete": True
+    },
     # 4. Test incomplete recipe
-    incomplete_id = db.save_plate_recipe(
-        chef_id=TEST_CHEF_ID,
-        name="Pasta Primavera",
-        description="Spring vegetable pasta - work in progress",
-        serves=4,
-        category="main",
-        cuisine="Italian",
-        is_complete=False  # Incomplete!
-    )
-    print(f"  ✅ Pasta Primavera [INCOMPLETE] (ID: {incomplete_id})")
+    {
+        "name": "Pasta Primavera",
+        "description": "Spring vegetable pasta - work in progress",
+        "serves": 4,
+        "category": "main",
+        "cuisine": "Italian",
+        "is_complete": False  # Incomplete!
+    },
+]
+
+
+def seed_data():
+    """Insert dummy data for testing"""
+    
+    print("🌱 Seeding database with test data...")
+    print("=" * 60)
+    
+    # Each list goes in as one transaction of multi-row INSERTs
+    print("\n📦 Creating Batch Recipes...")
+    batch_ids = db.save_batch_recipes_bulk(TEST_CHEF_ID, BATCH_RECIPES, bulk_load=True)
+    for recipe, recipe_id in zip(BATCH_RECIPES, batch_ids):
+        print(f"  ✅ {recipe['name']} (ID: {recipe_id})")
+    
+    print("\n🍽️ Creating Plate Recipes...")
+    plate_ids = db.save_plate_recipes_bulk(TEST_CHEF_ID, PLATE_RECIPES, bulk_load=True)
+    for recipe, recipe_id in zip(PLATE_RECIPES, plate_ids):
+        status = "" if recipe.get('is_complete') else " [INCOMPLETE]"
+        print(f"  ✅ {recipe['name']}{status} (ID: {recipe_id})")
     
     # ========== SUMMARY ==========
     
@@ -223,8 +210,8 @@ def seed_data():
     print("=" * 60)
     print(f"\n📍 Test Chef ID: {TEST_CHEF_ID}")
     print("\nCreated:")
-    print(f"  • 4 Batch Recipes (sauces, stocks, components)")
-    print(f"  • 4 Plate Recipes (final dishes)")
+    print(f"  • {len(batch_ids)} Batch Recipes (sauces, stocks, components)")
+    print(f"  • {len(plate_ids)} Plate Recipes (final dishes)")
     print("\nYou can now test with:")
     print('  "Find my chicken biryani recipe"')
     print('  "What batch recipes do I have?"')
@@ -3,10 +3,11 @@ Simplified Voice Agent Server - No LiveKit Cloud Required
 Direct WebSocket connection for voice streaming
 """
 import asyncio
-import json
 import logging
 import os
 import base64
+import functools
+import orjson
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -14,14 +15,24 @@ from quart import Quart, websocket, request
 from quart_cors import cors
 
 import database as db
-from prompts import SYSTEM_PROMPT
+from identity import new_chef_identity
+from prompts import FULL_SYSTEM_PROMPT
 
 # Audio processing
 import io
+import math
 import wave
+from array import array
 
-# Groq for LLM
-from groq import Groq
+# Optional WebRTC VAD for utterance segmentation (falls back to RMS energy)
+try:
+    import webrtcvad
+    VAD = webrtcvad.Vad(3)
+except ImportError:
+    VAD = None
+
+# Groq for LLM (async client: streaming must not block the event loop)
+from groq import AsyncGroq
 
 load_dotenv()
 
@@ -31,14 +42,14 @@ logger = logging.getLogger(__name__)
 
 # Initialize
 db.init_db()
-groq_client = Groq(api_key=os.getenv('GROQ_API_KEY'))
+groq_client = AsyncGroq(api_key=os.getenv('GROQ_API_KEY'))
 
 # Create Quart app
 app = Quart(__name__)
 app = cors(app, allow_origin="*")
 
-# Groq tools definition
-GROQ_TOOLS = [
+# Groq tools definition (a tuple: shared by every session, never mutated)
+GROQ_TOOLS = (
     {
         "type": "function",
         "function": {
@@ -71,16 +82,55 @@ GROQ_TOOLS = [
             }
         }
     }
-]
+)
+
+# Incoming audio: 16 kHz mono 16-bit PCM frames.
+# Frames are buffered until TRAILING_SILENCE_MS of silence follows speech,
+# so the STT -> LLM pipeline runs once per utterance instead of once per frame.
+SAMPLE_RATE = 16000
+TRAILING_SILENCE_MS = 500
+SILENCE_RMS_THRESHOLD = 500
+
+
+def frame_duration_ms(frame: bytes) -> float:
+    """Duration of a 16-bit mono PCM frame"""
+    return len(frame) / 2 / SAMPLE_RATE * 1000
+
+
+def is_speech(frame: bytes) -> bool:
+    """WebRTC VAD when installed (10/20/30ms frames only), else RMS energy"""
+    if VAD is not None:
+        try:
+            return VAD.is_speech(frame, SAMPLE_RATE)
+        except Exception:
+            pass  # Unsupported frame length - fall through to RMS
+    
+    samples = array('h', frame[:len(frame) - len(frame) % 2])
+    if not samples:
+        return False
+    rms = math.sqrt(sum(x * x for x in samples) / len(samples))
+    return rms > SILENCE_RMS_THRESHOLD
+
+
+# Completion budgets per call site
+FIRST_TURN_MAX_TOKENS = 500
+FINAL_TURN_MAX_TOKENS = 150
+
+
+# Shared by every session so the prompt string isn't copied per connection,
+# and every request starts with the identical prefix Groq can cache
+SYSTEM_PROMPT_MSG = {"role": "system", "content": FULL_SYSTEM_PROMPT}
 
 
 class VoiceSession:
     def __init__(self, chef_id: str):
         self.chef_id = chef_id
-        self.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        self.messages = [SYSTEM_PROMPT_MSG]
+        # One LLM turn at a time - audio and text turns share self.messages
+        self.turn_lock = asyncio.Lock()
         
-    async def process_audio(self, audio_data: bytes) -> Optional[str]:
-        """Process audio through STT -> LLM -> TTS"""
+    async def process_audio(self, audio_data: bytes, send) -> Optional[str]:
+        """Process audio through STT -> LLM -> TTS, streaming the reply through send()"""
         try:
             # 1. Speech-to-Text (using Deepgram or Groq Whisper)
             # For now, simulate - you'd integrate real STT here
@@ -88,68 +138,97 @@ class VoiceSession:
             if not user_text:
                 return None
                 
-            logger.info(f"User said: {user_text}")
+            logger.info("User said: %s", user_text)
             
             # 2. LLM Processing
             self.messages.append({"role": "user", "content": user_text})
+            return await self.respond(send)
             
-            response = groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=self.messages,
-                tools=GROQ_TOOLS,
-                tool_choice="auto",
-                temperature=0.3,
-                max_tokens=500
-            )
+        except Exception as e:
+            logger.error("Error processing audio: %s", e, exc_info=True)
+            response_text = "I'm sorry, I had trouble processing that."
+            await send({"type": "message_end", "role": "assistant", "text": response_text})
+            return response_text
+    
+    async def stream_completion(self, send, max_tokens: int, **kwargs):
+        """
+        Stream one Groq completion, forwarding text deltas as they arrive.
+        Tool calls arrive in fragments, so their arguments are accumulated by index.
+        Returns (text, tool_calls)
+        """
+        stream = await groq_client.chat.completions.create(
+            model="llama-3.3-70b-versatile",
+            messages=self.messages,
+            temperature=0.3,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+        
+        text_parts = []
+        tool_calls = {}
+        async for chunk in stream:
+            delta = chunk.choices[0].delta
             
-            assistant_message = response.choices[0].message
+            if delta.content:
+                text_parts.append(delta.content)
+                await send({"type": "message_delta", "text": delta.content})
             
-            # Handle function calls
-            if assistant_message.tool_calls:
-                for tool_call in assistant_message.tool_calls:
-                    func_name = tool_call.function.name
-                    func_args = json.loads(tool_call.function.arguments)
-                    
-                    # Execute function
-                    result = await self.execute_function(func_name, func_args)
-                    
-                    # Add to messages
-                    self.messages.append({
-                        "role": "assistant",
-                        "tool_calls": [{
-                            "id": tool_call.id,
-                            "type": "function",
-                            "function": {
-                                "name": func_name,
-                                "arguments": tool_call.function.arguments
-                            }
-                        }]
-                    })
-                    self.messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(result)
-                    })
-                
-                # Get final response
-                final_response = groq_client.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
-                    messages=self.messages,
-                    temperature=0.3,
-                    max_tokens=500
-                )
-                response_text = final_response.choices[0].message.content
-            else:
-                response_text = assistant_message.content
-                
-            self.messages.append({"role": "assistant", "content": response_text})
-            logger.info(f"Assistant: {response_text}")
+            for tc in delta.tool_calls or []:
+                call = tool_calls.setdefault(tc.index, {"id": None, "name": "", "arguments": ""})
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function and tc.function.name:
+                    call["name"] += tc.function.name
+                if tc.function and tc.function.arguments:
+                    call["arguments"] += tc.function.arguments
+        
+        return "".join(text_parts), [tool_calls[i] for i in sorted(tool_calls)]
+    
+    async def respond(self, send) -> str:
+        """Run the LLM on the current history, executing tool calls and streaming the answer"""
+        # First turn may answer directly or call tools - full budget
+        response_text, tool_calls = await self.stream_completion(
+            send, max_tokens=FIRST_TURN_MAX_TOKENS, tools=GROQ_TOOLS, tool_choice="auto"
+        )
+        
+        # Handle function calls
+        if tool_calls:
+            # Execute all functions concurrently - they're independent DB round-trips
+            results = await asyncio.gather(*[
+                self.execute_function(tc["name"], orjson.loads(tc["arguments"] or "{}"))
+                for tc in tool_calls
+            ])
             
-            return response_text
+            # Add to messages: one assistant turn carrying every call, then one result each
+            self.messages.append({
+                "role": "assistant",
+                "tool_calls": [{
+                    "id": tc["id"],
+                    "type": "function",
+                    "function": {
+                        "name": tc["name"],
+                        "arguments": tc["arguments"]
+                    }
+                } for tc in tool_calls]
+            })
+            for tc, result in zip(tool_calls, results):
+                self.messages.append({
+                    "role": "tool",
+                    "tool_call_id": tc["id"],
+                    "content": orjson.dumps(result, default=str).decode()
+                })
             
-        except Exception as e:
-            logger.error(f"Error processing audio: {e}", exc_info=True)
-            return "I'm sorry, I had trouble processing that."
+            # Get final response - a short spoken confirmation of the tool results
+            response_text, _ = await self.stream_completion(send, max_tokens=FINAL_TURN_MAX_TOKENS)
+        
+        self.messages.append({"role": "assistant", "content": response_text})
+        logger.info("Assistant: %s", response_text)
+        
+        # Tells the client the reply is complete (flush TTS)
+        await send({"type": "message_end", "role": "assistant", "text": response_text})
+        
+        return response_text
     
     async def speech_to_text(self, audio_data: bytes) -> Optional[str]:
         """Convert speech to text using Groq Whisper"""
@@ -163,14 +242,17 @@ class VoiceSession:
             return None
             
         except Exception as e:
-            logger.error(f"STT error: {e}")
+            logger.error("STT error: %s", e)
             return None
     
     async def execute_function(self, func_name: str, args: dict) -> dict:
         """Execute database function"""
+        # psycopg2 is blocking; run DB calls on a worker thread (the pool is thread-safe)
+        # so the websocket event loop keeps serving other sessions
         try:
             if func_name == "save_plate_recipe":
-                recipe_id = db.save_plate_recipe(
+                recipe_id = await asyncio.to_thread(
+                    db.save_plate_recipe,
                     chef_id=self.chef_id,
                     name=args.get("name"),
                     serves=args.get("serves"),
@@ -186,86 +268,124 @@ class VoiceSession:
                 }
             
             elif func_name == "search_recipes":
-                results = db.smart_search_recipes(
+                # db.smart_search_recipes caches per (chef, query) and is
+                # invalidated on every save/update/delete
+                return await asyncio.to_thread(
+                    db.smart_search_recipes,
                     chef_id=self.chef_id,
                     query=args.get("query")
                 )
-                return results
             
             return {"success": False, "message": "Unknown function"}
             
         except Exception as e:
-            logger.error(f"Function execution error: {e}")
+            logger.error("Function execution error: %s", e)
             return {"success": False, "message": str(e)}
 
 
+async def send_json_fast(ws, obj):
+    """Send obj as a JSON text frame, encoded with orjson instead of Quart's stdlib send_json"""
+    await ws.send(orjson.dumps(obj).decode())
+
+
 @app.websocket('/ws/voice')
 async def voice_websocket():
     """WebSocket endpoint for voice communication"""
-    chef_id = f"chef-{os.urandom(4).hex()}"
+    chef_id = new_chef_identity()
     session = VoiceSession(chef_id)
     
-    logger.info(f"New voice session: {chef_id}")
+    logger.info("New voice session: %s", chef_id)
+    send = functools.partial(send_json_fast, websocket)
     
     # Send greeting
-    await websocket.send_json({
+    await send({
         "type": "message",
         "role": "assistant",
         "text": "Hello! I'm Tullia, your chef assistant. I can help you document recipes. What would you like to do today?"
     })
     
-    try:
+    # One reader routes frames by type onto two queues, so audio and control
+    # are handled by their own coroutines instead of one branching loop
+    audio_queue = asyncio.Queue()
+    control_queue = asyncio.Queue()
+    
+    async def reader():
         while True:
             data = await websocket.receive()
-            
-            # Handle different message types
             if isinstance(data, bytes):
-                # Audio data
-                response_text = await session.process_audio(data)
-                if response_text:
-                    await websocket.send_json({
-                        "type": "message",
-                        "role": "assistant",
-                        "text": response_text
-                    })
+                audio_queue.put_nowait(data)
+            else:
+                control_queue.put_nowait(data)
+    
+    async def audio_worker():
+        utterance = bytearray()
+        heard_speech = False
+        silence_ms = 0.0
+        
+        while True:
+            try:
+                frame = await asyncio.wait_for(audio_queue.get(), timeout=TRAILING_SILENCE_MS / 1000)
+            except asyncio.TimeoutError:
+                frame = None  # Client stopped sending - treat as trailing silence
             
-            elif isinstance(data, str):
-                # JSON message
-                try:
-                    msg = json.loads(data)
-                    
-                    if msg.get("type") == "text":
-                        # Text message from user
-                        user_text = msg.get("text")
-                        session.messages.append({"role": "user", "content": user_text})
-                        
-                        # Process with LLM
-                        response = groq_client.chat.completions.create(
-                            model="llama-3.3-70b-versatile",
-                            messages=session.messages,
-                            tools=GROQ_TOOLS,
-                            tool_choice="auto",
-                            temperature=0.3,
-                            max_tokens=500
-                        )
-                        
-                        response_text = response.choices[0].message.content
-                        session.messages.append({"role": "assistant", "content": response_text})
-                        
-                        await websocket.send_json({
-                            "type": "message",
-                            "role": "assistant",
-                            "text": response_text
-                        })
+            if frame is not None:
+                utterance += frame
+                if is_speech(frame):
+                    heard_speech = True
+                    silence_ms = 0.0
+                else:
+                    silence_ms += frame_duration_ms(frame)
                 
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON received")
+                if not heard_speech:
+                    utterance.clear()  # Don't accumulate leading silence
+                    continue
+                if silence_ms < TRAILING_SILENCE_MS:
+                    continue
+            elif not heard_speech:
+                continue
+            
+            # End of utterance - reply is streamed as message_delta / message_end
+            data = bytes(utterance)
+            utterance.clear()
+            heard_speech = False
+            silence_ms = 0.0
+            async with session.turn_lock:
+                await session.process_audio(data, send)
+    
+    async def control_worker():
+        while True:
+            data = await control_queue.get()
+            try:
+                msg = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                logger.error("Invalid JSON received")
+                continue
+            
+            if msg.get("type") == "text":
+                # Text message from user
+                async with session.turn_lock:
+                    session.messages.append({"role": "user", "content": msg.get("text")})
+                    # Process with LLM, streaming the reply
+                    try:
+                        await session.respond(send)
+                    except Exception as e:
+                        logger.error("Error processing text: %s", e, exc_info=True)
+                        await send({"type": "message_end", "role": "assistant", "text": "I'm sorry, I had trouble processing that."})
+    
+    tasks = [asyncio.create_task(coro) for coro in (reader(), audio_worker(), control_worker())]
+    try:
+        # Runs until the socket closes or a worker fails
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
     
     except asyncio.CancelledError:
-        logger.info(f"Session closed: {chef_id}")
+        logger.info("Session closed: %s", chef_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}", exc_info=True)
-
+        logger.error("WebSocket error: %s", e, exc_info=True)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 @app.route('/health')
 async def health():
@@ -281,4 +401,12 @@ if __name__ == "__main__":
     logger.info("❤️  Health: http://localhost:3000/health")
     logger.info("=" * 60)
     
-    app.run(host="0.0.0.0", port=3000, debug=True)
+    # Served through hypercorn directly (app.run can't take a Config) so the
+    # websocket gets keep-alive pings; hypercorn negotiates permessage-deflate
+    # with clients that offer it, compressing the JSON frames on the wire
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    
+    config = Config.from_mapping(bind=["0.0.0.0:3000"], websocket_ping_interval=20)
+    app.debug = True
+    asyncio.run(serve(app, config))
@@ -9,8 +9,24 @@ from pathlib import Path
 # Add current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+def run_token_server(port: int):
+    """
+    Serve the token app with hypercorn in its own process.
+    Separate process = separate GIL, so token issuance isn't slowed by the agent.
+    """
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    from token_server import app
+    
+    config = Config.from_mapping(bind=[f"0.0.0.0:{port}"])
+    asyncio.run(serve(app, config, mode="wsgi"))
+
+
 if __name__ == "__main__":
     import logging
+    import multiprocessing
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
     
@@ -22,15 +38,12 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info(f"Token Server Port: {port}")
     
-    # Start token server in background thread
-    from token_server import app
-    import threading
-    
-    def run_token_server():
-        app.run(host='0.0.0.0', port=port, debug=False)
-    
-    token_thread = threading.Thread(target=run_token_server, daemon=True)
-    token_thread.start()
+    # forkserver: the child starts clean instead of inheriting agent state
+    # (or a half-initialized DB pool) from this process
+    # (a local context, so the LiveKit CLI remains free to pick its own start method)
+    mp_context = multiprocessing.get_context('forkserver')
+    token_process = mp_context.Process(target=run_token_server, args=(port,), daemon=True)
+    token_process.start()
     
     logger.info(f"✅ Token server started on port {port}")
     logger.info("🎙️ Starting LiveKit agent...")
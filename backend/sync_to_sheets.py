@@ -5,14 +5,11 @@ Run this once to migrate all existing data
 
 import os
 import sys
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add backend directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from env import SHEETS_ID  # Loads .env once for this process
 import database as db
 import google_sheets
 
@@ -59,7 +56,7 @@ def main():
     print("=" * 60)
     print()
     print("Open your Google Sheet to see the synced data:")
-    print(f"https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID')}")
+    print(f"https://docs.google.com/spreadsheets/d/{SHEETS_ID}")
 
 
 if __name__ == "__main__":
@@ -5,14 +5,37 @@ Provides tokens for frontend to connect to LiveKit rooms
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from livekit import api
+import functools
 import os
+import time
 from dotenv import load_dotenv
 
+from identity import new_chef_identity
+
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
 
+# Signed tokens are reused within a 5-minute bucket, so reconnecting
+# frontends don't re-sign an identical JWT every request
+TOKEN_REUSE_SECONDS = 300
+
+@functools.lru_cache(maxsize=4096)
+def _signed_token(api_key: str, api_secret: str, identity: str, name: str, room: str, bucket: int) -> str:
+    """Build and sign a room-join token (bucket only varies the cache key)"""
+    return api.AccessToken(api_key, api_secret) \
+        .with_identity(identity) \
+        .with_name(name) \
+        .with_grants(api.VideoGrants(
+            room_join=True,
+            room=room,
+            can_publish=True,
+            can_subscribe=True,
+            can_publish_data=True,
+        )) \
+        .to_jwt()
+
 @app.route('/get-token', methods=['POST'])
 def get_token():
     """Generate LiveKit access token"""
@@ -20,7 +43,7 @@ def get_token():
         data = request.get_json()
         
         room_name = data.get('room', 'chef-session')
-        participant_identity = data.get('identity', f'chef-{os.urandom(4).hex()}')
+        participant_identity = data.get('identity') or new_chef_identity()
         participant_name = data.get('name', participant_identity)
         
         # Get LiveKit credentials
@@ -30,19 +53,11 @@ def get_token():
         if not api_key or not api_secret:
             return jsonify({'error': 'LiveKit credentials not configured'}), 500
         
-        # Generate token
-        token = api.AccessToken(api_key, api_secret) \
-            .with_identity(participant_identity) \
-            .with_name(participant_name) \
-            .with_grants(api.VideoGrants(
-                room_join=True,
-                room=room_name,
-                can_publish=True,
-                can_subscribe=True,
-                can_publish_data=True,
-            ))
-        
-        jwt_token = token.to_jwt()
+        # Generate token (cached per identity/room for TOKEN_REUSE_SECONDS)
+        jwt_token = _signed_token(
+            api_key, api_secret, participant_identity, participant_name, room_name,
+            int(time.time() // TOKEN_REUSE_SECONDS)
+        )
         
         return jsonify({
             'token': jwt_token,
@@ -2,7 +2,14 @@
 Gemini Function Calling Tools
 Define function schemas for structured recipe operations
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Literal, get_args
+
+# Enumerated argument values - declared once, the schema "enum" arrays are derived from these
+RecipeType = Literal["batch", "plate"]
+SearchRecipeType = Literal["batch", "plate", "both"]
+Confidence = Literal["high", "medium", "low"]
+TemperatureUnit = Literal["C", "F"]
+Difficulty = Literal["easy", "medium", "hard"]
 
 # Tool: Classify recipe type
 CLASSIFY_RECIPE_TYPE_TOOL = {
@@ -13,12 +20,12 @@ CLASSIFY_RECIPE_TYPE_TOOL = {
         "properties": {
             "recipe_type": {
                 "type": "string",
-                "enum": ["batch", "plate"],
+                "enum": list(get_args(RecipeType)),
                 "description": "Type of recipe: 'batch' for large-scale components/bases, 'plate' for final assembled dishes"
             },
             "confidence": {
                 "type": "string",
-                "enum": ["high", "medium", "low"],
+                "enum": list(get_args(Confidence)),
                 "description": "Confidence level in classification"
             },
             "reasoning": {
@@ -67,7 +74,7 @@ SAVE_BATCH_RECIPE_TOOL = {
             },
             "temperature_unit": {
                 "type": "string",
-                "enum": ["C", "F"],
+                "enum": list(get_args(TemperatureUnit)),
                 "description": "Temperature unit (Celsius or Fahrenheit)"
             },
             "equipment": {
@@ -152,7 +159,7 @@ SAVE_PLATE_RECIPE_TOOL = {
             },
             "difficulty": {
                 "type": "string",
-                "enum": ["easy", "medium", "hard"],
+                "enum": list(get_args(Difficulty)),
                 "description": "Difficulty level"
             },
             "batch_recipes": {
@@ -207,7 +214,7 @@ SEARCH_RECIPES_TOOL = {
             },
             "recipe_type": {
                 "type": "string",
-                "enum": ["batch", "plate", "both"],
+                "enum": list(get_args(SearchRecipeType)),
                 "description": "Type of recipe to search for"
             }
         },
@@ -228,7 +235,7 @@ GET_RECIPE_DETAILS_TOOL = {
             },
             "recipe_type": {
                 "type": "string",
-                "enum": ["batch", "plate"],
+                "enum": list(get_args(RecipeType)),
                 "description": "Type of recipe if known"
             }
         },
@@ -249,7 +256,7 @@ ANALYZE_COMPLETENESS_TOOL = {
             },
             "recipe_type": {
                 "type": "string",
-                "enum": ["batch", "plate"],
+                "enum": list(get_args(RecipeType)),
                 "description": "Type of recipe"
             }
         },
@@ -284,9 +291,9 @@ ALL_TOOLS = [
     LIST_RECIPES_TOOL
 ]
 
+# Name -> tool lookup, built once
+_TOOLS_BY_NAME = {tool["name"]: tool for tool in ALL_TOOLS}
+
 def get_tool_by_name(name: str) -> Dict[str, Any]:
     """Get tool definition by name"""
-    for tool in ALL_TOOLS:
-        if tool["name"] == name:
-            return tool
-    return None
+    return _TOOLS_BY_NAME.get(name)
@@ -4,13 +4,12 @@ Check Google Sheets for Butter Chicken
 import sys
 sys.path.append('backend')
 
+# Words a sheet row's name must contain (already casefolded)
+SEARCH_TERMS = ('butter', 'chicken')
+
 try:
     import google_sheets
-    from dotenv import load_dotenv
-    import os
-    
-    load_dotenv()
-    spreadsheet_id = os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID')
+    from env import SHEETS_ID as spreadsheet_id
     
     print("GOOGLE SHEETS VERIFICATION")
     print("=" * 60)
@@ -18,28 +17,43 @@ try:
     
     service = google_sheets.get_service()
     
-    # Read Plate Recipes sheet
+    # Read only the Name column to locate Butter Chicken - the full rows are
+    # fetched afterwards for the matches alone
     result = service.spreadsheets().values().get(
         spreadsheetId=spreadsheet_id,
-        range='Plate Recipes!A:K'
+        range='Plate Recipes!B:B',
+        majorDimension='COLUMNS',
+        fields='values'
     ).execute()
     
-    values = result.get('values', [])
-    print(f"\nTotal rows in sheet: {len(values)}")
+    names = (result.get('values') or [[]])[0]
+    print(f"\nTotal rows in sheet: {len(names)}")
     
-    if values:
-        # Find Butter Chicken
-        found = False
-        for i, row in enumerate(values):
-            if len(row) > 1 and 'butter' in row[1].lower() and 'chicken' in row[1].lower():
-                print(f"\nFound at row {i+1}:")
-                print(f"  ID: {row[0] if len(row) > 0 else 'N/A'}")
-                print(f"  Name: {row[1] if len(row) > 1 else 'N/A'}")
-                print(f"  Chef: {row[2] if len(row) > 2 else 'N/A'}")
-                print(f "  Serves: {row[3] if len(row) > 3 else 'N/A'}")
-                found = True
+    if names:
+        # Find Butter Chicken: casefold each name once, collect matching row numbers in one pass
+        matches = [i for i, name in enumerate(map(str.casefold, names))
+                   if all(term in name for term in SEARCH_TERMS)]
+        
+        if matches:
+            # One request for just the matching rows (A:D)
+            result = service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=[f'Plate Recipes!A{i+1}:D{i+1}' for i in matches],
+                majorDimension='ROWS',
+                fields='valueRanges/values'
+            ).execute()
+            rows = [(vr.get('values') or [[]])[0] for vr in result.get('valueRanges', [])]
+        else:
+            rows = []
+        
+        for i, row in zip(matches, rows):
+            print(f"\nFound at row {i+1}:")
+            print(f"  ID: {row[0] if len(row) > 0 else 'N/A'}")
+            print(f"  Name: {row[1] if len(row) > 1 else 'N/A'}")
+            print(f"  Chef: {row[2] if len(row) > 2 else 'N/A'}")
+            print(f"  Serves: {row[3] if len(row) > 3 else 'N/A'}")
         
-        if not found:
+        if not matches:
             print("\nNOT FOUND in Google Sheets")
     else:
         print("\nSheet is EMPTY")
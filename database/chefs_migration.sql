@@ -0,0 +1,17 @@
+-- ========================================
+-- CHEFS TABLE MIGRATION
+-- ========================================
+-- Purpose: Create the chefs table and the demo chef used by seed scripts
+-- Idempotent: safe to run on every deploy
+-- ========================================
+
+CREATE TABLE IF NOT EXISTS chefs (
+    chef_id VARCHAR(255) PRIMARY KEY,
+    name VARCHAR(255),
+    email VARCHAR(255)
+);
+
+-- Demo chef that owns the seeded British & American dishes
+INSERT INTO chefs (chef_id, name, email)
+VALUES ('mock_user', 'Demo Chef', 'demo@tullia.ai')
+ON CONFLICT (chef_id) DO NOTHING;
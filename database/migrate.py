@@ -2,18 +2,20 @@
 Database Migration Script
 Connects to NeonDB and creates all required tables for the Chef Voice AI Agent.
 """
+import hashlib
+import mmap
 import os
 import sys
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Environment is parsed once in backend/env.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from env import DATABASE_URL
 
 def run_migration():
     """Execute database migration from schema.sql"""
-    database_url = os.getenv('DATABASE_URL')
+    database_url = DATABASE_URL
     
     if not database_url:
         print("❌ ERROR: DATABASE_URL not found in environment variables")
@@ -29,20 +31,39 @@ def run_migration():
         
         print("✅ Connected successfully!")
         
-        # Read schema file
-        schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-        
-        if not os.path.exists(schema_path):
-            print(f"❌ ERROR: Schema file not found at {schema_path}")
-            sys.exit(1)
-        
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema_sql = f.read()
-        
-        print("🔄 Executing schema migration...")
+        # Hashes of the SQL files already applied - unchanged files are skipped
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                hash TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                applied_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        """)
         
-        # Execute schema
-        cursor.execute(schema_sql)
+        # Execute schema, then the chefs migration (chefs table + demo chef)
+        for filename in ('schema.sql', 'chefs_migration.sql'):
+            schema_path = os.path.join(os.path.dirname(__file__), filename)
+            
+            if not os.path.exists(schema_path):
+                print(f"❌ ERROR: Schema file not found at {schema_path}")
+                sys.exit(1)
+            
+            with open(schema_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.blake2b(mm, digest_size=16).hexdigest()
+                
+                cursor.execute("SELECT 1 FROM schema_migrations WHERE hash = %s", (digest,))
+                if cursor.fetchone():
+                    print(f"⏭️  {filename} unchanged since last run - skipping")
+                    continue
+                
+                schema_sql = mm[:].decode('utf-8')
+            
+            print(f"🔄 Executing {filename}...")
+            cursor.execute(schema_sql)
+            cursor.execute(
+                "INSERT INTO schema_migrations (hash, filename) VALUES (%s, %s) ON CONFLICT (hash) DO NOTHING",
+                (digest, filename)
+            )
         
         print("✅ Schema migration completed successfully!")
         
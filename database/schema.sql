@@ -113,9 +113,65 @@ CREATE TABLE IF NOT EXISTS conversations (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Merge duplicate (chef_id, name) ingredients so the unique index below can be
+-- built on existing databases. References are repointed to the oldest row;
+-- link rows that would then collide with a recipe's existing row are dropped.
+DO $$
+DECLARE
+    link RECORD;
+BEGIN
+    IF to_regclass('idx_ingredients_chef_name') IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    DROP TABLE IF EXISTS ingredient_dupes;
+    CREATE TEMP TABLE ingredient_dupes AS
+    SELECT id AS dupe_id, keep_id
+    FROM (
+        SELECT id,
+               FIRST_VALUE(id) OVER (PARTITION BY chef_id, name ORDER BY created_at, id) AS keep_id
+        FROM ingredients
+    ) ranked
+    WHERE id <> keep_id;
+
+    FOR link IN
+        SELECT * FROM (VALUES
+            ('batch_ingredients', 'batch_recipe_id'),
+            ('plate_ingredients', 'plate_recipe_id'),
+            ('plate_version_ingredients', 'version_id'),
+            ('batch_version_ingredients', 'version_id')
+        ) AS t(tbl, owner_col)
+    LOOP
+        -- Version tables come from versioning_migration.sql and may not exist yet
+        CONTINUE WHEN to_regclass(link.tbl) IS NULL;
+
+        EXECUTE format(
+            'DELETE FROM %1$I t USING ingredient_dupes d
+             WHERE t.ingredient_id = d.dupe_id
+               AND EXISTS (
+                   SELECT 1 FROM %1$I o
+                   LEFT JOIN ingredient_dupes od ON od.dupe_id = o.ingredient_id
+                   WHERE o.%2$I = t.%2$I
+                     AND COALESCE(od.keep_id, o.ingredient_id) = d.keep_id
+                     AND (od.dupe_id IS NULL OR o.id < t.id)
+               )',
+            link.tbl, link.owner_col);
+
+        EXECUTE format(
+            'UPDATE %I t SET ingredient_id = d.keep_id
+             FROM ingredient_dupes d
+             WHERE t.ingredient_id = d.dupe_id',
+            link.tbl);
+    END LOOP;
+
+    DELETE FROM ingredients WHERE id IN (SELECT dupe_id FROM ingredient_dupes);
+    DROP TABLE ingredient_dupes;
+END $$;
+
 -- Indexes for performance optimization
 CREATE INDEX IF NOT EXISTS idx_ingredients_chef_id ON ingredients(chef_id);
 CREATE INDEX IF NOT EXISTS idx_ingredients_name ON ingredients(name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ingredients_chef_name ON ingredients(chef_id, name);  -- Upsert target
 CREATE INDEX IF NOT EXISTS idx_batch_recipes_chef_id ON batch_recipes(chef_id);
 CREATE INDEX IF NOT EXISTS idx_batch_recipes_name ON batch_recipes(name);
 CREATE INDEX IF NOT EXISTS idx_plate_recipes_chef_id ON plate_recipes(chef_id);
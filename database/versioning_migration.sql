@@ -173,6 +173,12 @@ CREATE INDEX IF NOT EXISTS idx_plate_versions_recipe
 CREATE INDEX IF NOT EXISTS idx_batch_versions_recipe 
     ON batch_recipe_versions(recipe_id, version_number DESC);
 
+-- Covering index for the version-history projection
+-- (version_number, is_active, change_summary) -> index-only scans, no heap fetches
+CREATE INDEX IF NOT EXISTS idx_prv_recipe_cover 
+    ON plate_recipe_versions(recipe_id, version_number) 
+    INCLUDE (is_active, change_summary);
+
 -- Fast ingredient lookups for versions
 CREATE INDEX IF NOT EXISTS idx_plate_version_ingredients_version 
     ON plate_version_ingredients(version_id);
@@ -187,6 +193,10 @@ CREATE INDEX IF NOT EXISTS idx_plate_versions_created_by
 CREATE INDEX IF NOT EXISTS idx_batch_versions_created_by 
     ON batch_recipe_versions(created_by);
 
+-- Refresh planner stats so the covering index is picked up straight away
+-- (VACUUM can't run inside the migration transaction; autovacuum sets the visibility map)
+ANALYZE plate_recipe_versions;
+
 -- ========================================
 -- 4. OPTIONAL: MIGRATE EXISTING RECIPES
 -- ========================================
@@ -219,6 +229,6 @@ CREATE INDEX IF NOT EXISTS idx_batch_versions_created_by
 --   - plate_version_ingredients (ingredient snapshots)
 --   - batch_recipe_versions (metadata snapshots)
 --   - batch_version_ingredients (ingredient snapshots)
--- Indexes: 8 indexes for performance
+-- Indexes: 9 indexes for performance
 -- Constraints: Unique constraints + GIST exclusion for active versions
 -- ========================================
@@ -26,19 +26,15 @@ try:
     print(f"Recipe ID: {recipe_id}")
     
     # Check versions
-    conn = db.get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM plate_recipe_versions WHERE recipe_id = %s", (recipe_id,))
-    count = cur.fetchone()[0]
-    print(f"Versions created: {count}")
+    with db.get_conn() as conn, conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM plate_recipe_versions WHERE recipe_id = %s", (recipe_id,))
+        count = cur.fetchone()[0]
+        print(f"Versions created: {count}")
     
-    if count == 0:
-        print("ERROR: No version created!")
-    else:
-        print("SUCCESS: Version created!")
-    
-    cur.close()
-    db.return_connection(conn)
+        if count == 0:
+            print("ERROR: No version created!")
+        else:
+            print("SUCCESS: Version created!")
     
 except Exception as e:
     print(f"ERROR: {e}")
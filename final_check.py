@@ -1,22 +1,23 @@
 """Direct DB query - no emojis"""
-import os
-from dotenv import load_dotenv
+from decimal import Decimal
+import sys
 import psycopg2
+from psycopg2.extras import RealDictCursor
 
-load_dotenv()
-db_url = os.getenv('DATABASE_URL')
+sys.path.append('backend')
+from env import DATABASE_URL as db_url
 
 conn = psycopg2.connect(db_url)
-cur = conn.cursor()
+cur = conn.cursor(cursor_factory=RealDictCursor)
 
 # Step 1: Check if versioning table exists
 cur.execute("""
     SELECT EXISTS (
         SELECT FROM information_schema.tables 
         WHERE table_name = 'plate_recipe_versions'
-    );
+    ) AS table_exists;
 """)
-table_exists = cur.fetchone()[0]
+table_exists = cur.fetchone()['table_exists']
 print(f"Table 'plate_recipe_versions' exists: {table_exists}")
 
 if not table_exists:
@@ -30,22 +31,22 @@ if not table_exists:
 cur.execute("""
     SELECT id, name
     FROM plate_recipes
-    WHERE LOWER(name) LIKE '%butter%chicken%'
+    WHERE name ILIKE '%butter%chicken%'
     LIMIT 1
 """)
 
 recipe = cur.fetchone()
 if recipe:
-    recipe_id, name = recipe
+    recipe_id, name = recipe['id'], recipe['name']
     print(f"\nRecipe found: {name}")
     print(f"Recipe ID: {recipe_id}")
     
     # Step 3: Count versions
     cur.execute("""
-        SELECT COUNT(*) FROM plate_recipe_versions WHERE recipe_id = %s
+        SELECT COUNT(*) AS version_count FROM plate_recipe_versions WHERE recipe_id = %s
     """, (recipe_id,))
     
-    version_count = cur.fetchone()[0]
+    version_count = cur.fetchone()['version_count']
     print(f"Version count: {version_count}")
     
     if version_count == 0:
@@ -63,17 +64,16 @@ if recipe:
         versions = cur.fetchall()
         print(f"\nVersions found: {version_count}")
         for v in versions:
-            ver_num, is_active, change_summary = v
-            status = "ACTIVE" if is_active else "inactive"
-            print(f"  v{ver_num} ({status}): {change_summary}")
+            status = "ACTIVE" if v['is_active'] else "inactive"
+            print(f"  v{v['version_number']} ({status}): {v['change_summary']}")
             
         # Check for v1.1 specifically
-        has_v11 = any(v[0] == 1.1 for v in versions)
+        has_v11 = any(v['version_number'] == Decimal('1.1') for v in versions)
         if has_v11:
             print("\nVERDICT: Version 1.1 EXISTS - AI claim is TRUE")
         else:
             print(f"\nVERDICT: Version 1.1 NOT FOUND - AI claim is FALSE")
-            print(f"Versions present: {[v[0] for v in versions]}")
+            print(f"Versions present: {[v['version_number'] for v in versions]}")
 else:
     print("Recipe NOT found")
 
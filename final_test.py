@@ -47,89 +47,85 @@ recipe_id = db.save_plate_recipe(
 print(f"Recipe ID: {recipe_id}")
 
 # Check v1.0
-conn = db.get_connection()
-cur = conn.cursor()
-cur.execute("SELECT version_number, is_active FROM plate_recipe_versions WHERE recipe_id = %s", (recipe_id,))
-versions = cur.fetchall()
-print(f"Versions: {[(v[0], 'ACTIVE' if v[1] else 'inactive') for v in versions]}")
-
-if 1.0 in [v[0] for v in versions]:
-    print("SUCCESS: v1.0 created!")
-else:
-    print("FAIL: v1.0 NOT created")
-
-print("\n[STEP 2] Minor update: change serves from 8 to 10...")
-result = db.update_recipe(
-    chef_id=CHEF_ID,
-    recipe_name=RECIPE_NAME,
-    recipe_type="plate",
-    new_serves=10
-)
-
-print(f"Update result: {result['success']}")
-
-cur.execute("SELECT version_number, is_active, change_summary FROM plate_recipe_versions WHERE recipe_id = %s ORDER BY version_number", (recipe_id,))
-versions = cur.fetchall()
-print(f"Versions: {len(versions)}")
-for v_num, v_active, v_summary in versions:
-    print(f"  v{v_num} ({'ACTIVE' if v_active else 'inactive'}): {v_summary}")
-
-print("\n[STEP 3] Major update: change name, description, and category...")
-result = db.update_recipe(
-    chef_id=CHEF_ID,
-    recipe_name=RECIPE_NAME,
-    recipe_type="plate",
-    new_name="Ultimate Chocolate Indulgence",
-    new_description="Decadent triple-layer chocolate masterpiece",
-    new_category="Fine Dining Dessert"
-)
-
-print(f"Update result: {result['success']}")
-
-cur.execute("""
-    SELECT version_number, is_active, change_summary, created_at
-    FROM plate_recipe_versions 
-    WHERE recipe_id = %s 
-    ORDER BY version_number
-""", (recipe_id,))
-
-versions = cur.fetchall()
-
-print("\n" + "=" * 70)
-print("FINAL VERSION HISTORY:")
-print("=" * 70)
-
-for v_num, v_active, v_summary, v_created in versions:
-    status = "[ACTIVE]" if v_active else "[inactive]"
-    print(f"\nVersion {v_num} {status}")
-    print(f"  Created: {v_created}")
-    print(f"  Changes: {v_summary}")
-
-print("\n" + "=" * 70)
-print("TEST SUMMARY:")
-print("=" * 70)
-
-has_v10 = any(v[0] == 1.0 for v in versions)
-has_v11 = any(v[0] == 1.1 for v in versions)
-has_v20 = any(v[0] == 2.0 for v in versions)
-active_version = [v[0] for v in versions if v[1]]
-
-print(f"v1.0 created: {has_v10}")
-print(f"v1.1 created: {has_v11}")
-print(f"v2.0 created: {has_v20}")
-print(f"Active version: {active_version[0] if active_version else 'NONE'}")
-print(f"Total versions: {len(versions)}")
-
-if has_v10 and has_v11 and has_v20 and active_version == [2.0]:
-    print("\n*** ALL TESTS PASSED! Versioning is FULLY FUNCTIONAL! ***")
-else:
-    print("\n*** SOME TESTS FAILED ***")
-
-print("\nRecipe kept in database for verification.")
-print(f"Recipe ID: {recipe_id}")
-print(f"Current name: {result.get('new_name', RECIPE_NAME)}")
-
-cur.close()
-db.return_connection(conn)
+with db.get_conn() as conn, conn.cursor() as cur:
+    cur.execute("SELECT version_number, is_active FROM plate_recipe_versions WHERE recipe_id = %s", (recipe_id,))
+    versions = cur.fetchall()
+    print(f"Versions: {[(v[0], 'ACTIVE' if v[1] else 'inactive') for v in versions]}")
+
+    if 1.0 in [v[0] for v in versions]:
+        print("SUCCESS: v1.0 created!")
+    else:
+        print("FAIL: v1.0 NOT created")
+
+    print("\n[STEP 2] Minor update: change serves from 8 to 10...")
+    result = db.update_recipe(
+        chef_id=CHEF_ID,
+        recipe_name=RECIPE_NAME,
+        recipe_type="plate",
+        new_serves=10
+    )
+
+    print(f"Update result: {result['success']}")
+
+    cur.execute("SELECT version_number, is_active, change_summary FROM plate_recipe_versions WHERE recipe_id = %s ORDER BY version_number", (recipe_id,))
+    versions = cur.fetchall()
+    print(f"Versions: {len(versions)}")
+    for v_num, v_active, v_summary in versions:
+        print(f"  v{v_num} ({'ACTIVE' if v_active else 'inactive'}): {v_summary}")
+
+    print("\n[STEP 3] Major update: change name, description, and category...")
+    result = db.update_recipe(
+        chef_id=CHEF_ID,
+        recipe_name=RECIPE_NAME,
+        recipe_type="plate",
+        new_name="Ultimate Chocolate Indulgence",
+        new_description="Decadent triple-layer chocolate masterpiece",
+        new_category="Fine Dining Dessert"
+    )
+
+    print(f"Update result: {result['success']}")
+
+    cur.execute("""
+        SELECT version_number, is_active, change_summary, created_at
+        FROM plate_recipe_versions 
+        WHERE recipe_id = %s 
+        ORDER BY version_number
+    """, (recipe_id,))
+
+    versions = cur.fetchall()
+
+    print("\n" + "=" * 70)
+    print("FINAL VERSION HISTORY:")
+    print("=" * 70)
+
+    for v_num, v_active, v_summary, v_created in versions:
+        status = "[ACTIVE]" if v_active else "[inactive]"
+        print(f"\nVersion {v_num} {status}")
+        print(f"  Created: {v_created}")
+        print(f"  Changes: {v_summary}")
+
+    print("\n" + "=" * 70)
+    print("TEST SUMMARY:")
+    print("=" * 70)
+
+    has_v10 = any(v[0] == 1.0 for v in versions)
+    has_v11 = any(v[0] == 1.1 for v in versions)
+    has_v20 = any(v[0] == 2.0 for v in versions)
+    active_version = [v[0] for v in versions if v[1]]
+
+    print(f"v1.0 created: {has_v10}")
+    print(f"v1.1 created: {has_v11}")
+    print(f"v2.0 created: {has_v20}")
+    print(f"Active version: {active_version[0] if active_version else 'NONE'}")
+    print(f"Total versions: {len(versions)}")
+
+    if has_v10 and has_v11 and has_v20 and active_version == [2.0]:
+        print("\n*** ALL TESTS PASSED! Versioning is FULLY FUNCTIONAL! ***")
+    else:
+        print("\n*** SOME TESTS FAILED ***")
+
+    print("\nRecipe kept in database for verification.")
+    print(f"Recipe ID: {recipe_id}")
+    print(f"Current name: {result.get('new_name', RECIPE_NAME)}")
 
 print("\n" + "=" * 70)
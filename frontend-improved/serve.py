@@ -2,8 +2,10 @@
 Simple HTTP Server for Frontend
 Serves the frontend on http://localhost:8000
 """
+import gzip
+import hashlib
 import http.server
-import socketserver
+import io
 import os
 
 PORT = 8000
@@ -11,6 +13,31 @@ PORT = 8000
 # Change to frontend directory
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
+# Text assets worth gzipping
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# path -> ((mtime_ns, size), etag, gzipped body or None)
+# Rebuilt when a file changes on disk, so edits show up on the next reload
+_asset_cache = {}
+
+def _asset_info(path, content_type):
+    """ETag (blake2b of the contents) and, for text assets, the gzipped body"""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _asset_cache.get(path)
+    if cached and cached[0] == key:
+        return cached
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+    gz = gzip.compress(data) if content_type.startswith(COMPRESSIBLE_TYPES) else None
+    
+    _asset_cache[path] = (key, etag, gz)
+    return _asset_cache[path]
+
+
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
         # Add CORS headers
@@ -18,9 +45,59 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         super().end_headers()
+    
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split('?', 1)[0].endswith('/'):
+            path = os.path.join(path, 'index.html')
+        if not os.path.isfile(path):
+            # Directory redirects/listings and 404s
+            return super().do_GET()
+        
+        content_type = self.guess_type(path)
+        _, etag, gz = _asset_info(path, content_type)
+        
+        use_gzip = gz is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if use_gzip:
+            # Strong ETags must differ per encoding; the gzip body isn't the file's bytes
+            etag = etag[:-1] + '-gz"'
+        
+        # Conditional GET: unchanged variant -> 304 with no body
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(gz)))
+            self.end_headers()
+            self.wfile.write(gz)
+        else:
+            with open(path, 'rb') as f:
+                self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                self.end_headers()
+                self.copyfile(f, self.wfile)
+    
+    def copyfile(self, source, outputfile):
+        # Static files go straight from the page cache to the socket (os.sendfile)
+        try:
+            source.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            super().copyfile(source, outputfile)
+        else:
+            outputfile.flush()
+            self.connection.sendfile(source)
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    # Threaded: the browser fetches JS/CSS/assets in parallel
+    with http.server.ThreadingHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
         print("=" * 60)
         print(f"   Frontend Server Running")
         print("=" * 60)
@@ -1,6 +1,8 @@
 """
 Script to insert intermediate function tools into main.py
 """
+import io
+import textwrap
 
 # Read the tools to insert
 with open('backend/main_intermediate_tools.py', 'r', encoding='utf-8') as f:
@@ -13,18 +15,20 @@ with open('backend/main.py', 'r', encoding='utf-8') as f:
 # Find insertion point (line 127, after send_recipe_event method)
 insert_idx = 127  # 0-indexed, so this is line 128 in the file
 
-# Insert the tools
-new_lines = (
-    lines[:insert_idx] +
-    ['\n', '    # ============ INTERMEDIATE FUNCTION TOOLS FOR LIVE RECIPE BUILDING ============\n', '\n'] +
-    [('   ' + line) if line.strip() and not line.startswith(' ') else line for line in tools_code.split('\n')] +
-    ['\n', '    # ============ END INTERMEDIATE TOOLS ============\n', '\n'] +
-    lines[insert_idx:]
+# Insert the tools (indent unindented lines; textwrap keeps each line's newline)
+indented_tools = textwrap.indent(
+    tools_code, '   ', predicate=lambda line: line.strip() and not line.startswith(' ')
 )
+buf = io.StringIO()
+buf.writelines(lines[:insert_idx])
+buf.write('\n    # ============ INTERMEDIATE FUNCTION TOOLS FOR LIVE RECIPE BUILDING ============\n\n')
+buf.write(indented_tools)
+buf.write('\n    # ============ END INTERMEDIATE TOOLS ============\n\n')
+buf.writelines(lines[insert_idx:])
 
 # Write back
 with open('backend/main.py', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+    f.write(buf.getvalue())
 
 print("✅ Successfully inserted intermediate tools into main.py")
 print(f"Inserted at line {insert_idx + 1}")
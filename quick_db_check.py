@@ -4,35 +4,36 @@ Quick DB check - Find all recipes and their versions
 import sys
 sys.path.append('backend')
 import database as db
+from psycopg2.extras import RealDictCursor
 
-conn = db.get_connection()
-cur = conn.cursor()
+with db.get_conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+    # Check all plate recipes
+    print("📋 ALL PLATE RECIPES:")
+    cur.execute("SELECT id, name, chef_id FROM plate_recipes ORDER BY created_at DESC LIMIT 10")
+    recipes = cur.fetchall()
+    print(f"Found {len(recipes)} recipes:")
+    for r in recipes:
+        print(f"  - {r['name']} (ID: {r['id']}, Chef: {r['chef_id']})")
 
-# Check all plate recipes
-print("📋 ALL PLATE RECIPES:")
-cur.execute("SELECT id, name, chef_id FROM plate_recipes ORDER BY created_at DESC LIMIT 10")
-recipes = cur.fetchall()
-print(f"Found {len(recipes)} recipes:")
-for r in recipes:
-    print(f"  - {r[1]} (ID: {r[0]}, Chef: {r[2]})")
-
-print("\n📦 ALL PLATE RECIPE VERSIONS:")
-cur.execute("""
-    SELECT 
-        prv.recipe_id,
-        pr.name,
-        prv.version_number,
-        prv.is_active,
-        prv.change_summary
-    FROM plate_recipe_versions prv
-    JOIN plate_recipes pr ON prv.recipe_id = pr.id
-    ORDER BY pr.name, prv.version_number
-""")
-versions = cur.fetchall()
-print(f"Found {len(versions)} versions:")
-for v in versions:
-    status = "ACTIVE" if v[3] else "inactive"
-    print(f"  - {v[1]} v{v[2]} ({status}): {v[4]}")
-
-cur.close()
-db.return_connection(conn)
+    print("\n📦 ALL PLATE RECIPE VERSIONS:")
+    # Unbounded scan: stream through a server-side cursor in 1000-row chunks
+    versions_cur = conn.cursor(name='versions_scan', cursor_factory=RealDictCursor)
+    versions_cur.itersize = 1000
+    versions_cur.execute("""
+        SELECT 
+            prv.recipe_id,
+            pr.name,
+            prv.version_number,
+            prv.is_active,
+            prv.change_summary
+        FROM plate_recipe_versions prv
+        JOIN plate_recipes pr ON prv.recipe_id = pr.id
+        ORDER BY pr.name, prv.version_number
+    """)
+    found = 0
+    for v in versions_cur:
+        status = "ACTIVE" if v['is_active'] else "inactive"
+        print(f"  - {v['name']} v{v['version_number']} ({status}): {v['change_summary']}")
+        found += 1
+    print(f"Found {found} versions")
+    versions_cur.close()
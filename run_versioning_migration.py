@@ -15,42 +15,36 @@ def run_migration():
     with open('database/versioning_migration.sql', 'r') as f:
         migration_sql = f.read()
     
-    conn = db.get_connection()
-    cur = conn.cursor()
-    
-    try:
-        print("📝 Creating version tables...")
-        cur.execute(migration_sql)
-        conn.commit()
-        
-        print("✅ Migration completed!")
+    with db.get_conn() as conn, conn.cursor() as cur:
+        try:
+            print("📝 Creating version tables...")
+            cur.execute(migration_sql)
+            conn.commit()
         
-        # Verify
-        cur.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name LIKE '%version%'
-            ORDER BY table_name
-        """)
+            print("✅ Migration completed!")
         
-        tables = cur.fetchall()
-        print("\n✓ Verified tables:")
-        for table in tables:
-            print(f"  ✓ {table[0]}")
+            # Verify
+            cur.execute("""
+                SELECT table_name 
+                FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                AND table_name LIKE '%version%'
+                ORDER BY table_name
+            """)
         
-        return True
+            tables = cur.fetchall()
+            print("\n✓ Verified tables:")
+            for table in tables:
+                print(f"  ✓ {table[0]}")
         
-    except Exception as e:
-        conn.rollback()
-        print(f"❌ Failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+            return True
         
-    finally:
-        cur.close()
-        db.return_connection(conn)
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ Failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
 
 if __name__ == "__main__":
     success = run_migration()
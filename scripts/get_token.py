@@ -2,22 +2,33 @@
 LiveKit Access Token Generator
 Generates temporary access tokens for testing
 """
+import functools
 import os
+import time
 from livekit import api
 from dotenv import load_dotenv
 
-load_dotenv()
-
-def generate_token(room_name: str, participant_identity: str) -> str:
-    """Generate a LiveKit access token"""
-    
+@functools.lru_cache(maxsize=1)
+def _creds() -> tuple:
+    """LiveKit API key/secret, resolved from .env once per process"""
+    load_dotenv()
     api_key = os.getenv('LIVEKIT_API_KEY')
     api_secret = os.getenv('LIVEKIT_API_SECRET')
     
     if not api_key or not api_secret:
         raise ValueError("LIVEKIT_API_KEY and LIVEKIT_API_SECRET must be set")
     
-    token = api.AccessToken(api_key, api_secret) \
+    return api_key, api_secret
+
+# Identical (room, identity) requests within this window reuse the signed JWT
+TOKEN_REUSE_SECONDS = 300
+
+@functools.lru_cache(maxsize=1024)
+def _cached_jwt(room_name: str, participant_identity: str, bucket: int) -> str:
+    """Build and sign a room-join token (bucket only varies the cache key)"""
+    api_key, api_secret = _creds()
+    
+    return api.AccessToken(api_key, api_secret) \
         .with_identity(participant_identity) \
         .with_name(participant_identity) \
         .with_grants(api.VideoGrants(
@@ -25,16 +36,37 @@ def generate_token(room_name: str, participant_identity: str) -> str:
             room=room_name,
             can_publish=True,
             can_subscribe=True,
-        ))
+        )) \
+        .to_jwt()
+
+def generate_token(room_name: str, participant_identity: str,
+                   ttl_seconds: int = TOKEN_REUSE_SECONDS) -> str:
+    """Generate a LiveKit access token (reused for ttl_seconds; 0 always signs a new one)"""
+    if ttl_seconds <= 0:
+        return _cached_jwt.__wrapped__(room_name, participant_identity, 0)
     
-    return token.to_jwt()
+    return _cached_jwt(room_name, participant_identity, int(time.time() // ttl_seconds))
 
 if __name__ == '__main__':
+    import argparse
+    import csv
     import sys
     
-    room = sys.argv[1] if len(sys.argv) > 1 else 'chef-session'
-    identity = sys.argv[2] if len(sys.argv) > 2 else 'chef-test-user'
+    parser = argparse.ArgumentParser(description="Generate LiveKit access tokens")
+    parser.add_argument('room', nargs='?', default='chef-session')
+    parser.add_argument('identity', nargs='?', default='chef-test-user')
+    parser.add_argument('--batch', metavar='CSV', type=argparse.FileType('r', encoding='utf-8'),
+                        help="mint one token per 'room,identity' row ('-' for stdin); prints one JWT per line")
+    args = parser.parse_args()
     
-    token = generate_token(room, identity)
-    print(f"\n✅ Token generated for '{identity}' in room '{room}':")
-    print(f"\n{token}\n")
+    if args.batch:
+        # One interpreter/.env load for the whole batch; output buffered, flushed once
+        out = sys.stdout.buffer
+        for row in csv.reader(args.batch):
+            if len(row) >= 2:
+                out.write(generate_token(row[0], row[1]).encode() + b'\n')
+        out.flush()
+    else:
+        token = generate_token(args.room, args.identity)
+        print(f"\n✅ Token generated for '{args.identity}' in room '{args.room}':")
+        print(f"\n{token}\n")
@@ -0,0 +1,42 @@
+"""
+Unit tests for database.py helpers that don't need a live database
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+pytest.importorskip('psycopg2')
+pytest.importorskip('dotenv')
+db = pytest.importorskip('database')
+
+
+class FakeCursor:
+    """Captures what _copy_ingredient_rows sends through COPY"""
+    
+    def __init__(self):
+        self.sql = None
+        self.data = None
+    
+    def copy_expert(self, sql, buf):
+        self.sql = sql
+        self.data = buf.read()
+
+
+def test_copy_rows_keeps_empty_unit_as_empty_string():
+    cur = FakeCursor()
+    db._copy_ingredient_rows(cur, 'plate_version_ingredients', [
+        'version_id', 'ingredient_id', 'quantity', 'unit', 'preparation_notes', 'is_garnish', 'is_optional'
+    ], [('v1', 'i1', 2, '', None, False, False)])
+    
+    assert "NULL '\\N'" in cur.sql
+    # '' goes out as an empty field (empty string under NULL '\N'); None as \N
+    assert cur.data == 'v1\ti1\t2\t\t\\N\tFalse\tFalse\n'
+
+
+def test_copy_rows_skips_empty_batch():
+    cur = FakeCursor()
+    db._copy_ingredient_rows(cur, 'batch_ingredients', ['batch_recipe_id'], [])
+    assert cur.sql is None
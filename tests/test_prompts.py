@@ -0,0 +1,30 @@
+"""
+Unit tests for prompts
+"""
+import hashlib
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+import prompts
+from prompts import detect_intent
+
+# Bump deliberately when a prompt file changes; guards the canonical join/strip
+FULL_SYSTEM_PROMPT_SHA256 = "affc1a02927698a601fa5db053c6d3a48b0b873c52e3aeb252b50d7adf2c3b8f"
+
+
+def test_keywords_only_match_whole_words():
+    # "get" inside "vegetables" must not count as retrieve_recipe
+    assert detect_intent("Add vegetables to it") is None
+    assert detect_intent("Can you get the risotto") == "retrieve_recipe"
+
+
+def test_earlier_intent_wins_over_leftmost_match():
+    # "find" (retrieve_recipe) appears first in the text, but save_recipe is declared first
+    assert detect_intent("Find a spot, I'm documenting a new recipe") == "save_recipe"
+
+
+def test_full_system_prompt_is_pinned():
+    digest = hashlib.sha256(prompts.FULL_SYSTEM_PROMPT.encode("utf-8")).hexdigest()
+    assert digest == FULL_SYSTEM_PROMPT_SHA256
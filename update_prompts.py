@@ -1,17 +1,17 @@
 """
-Script to update prompts.py with live recipe building instructions
+Script to update the system prompt with live recipe building instructions
 """
+import mmap
+import os
+import tempfile
 
-# Read prompts.py
-with open('backend/prompts.py', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Find the insertion point (after "**IMPORTANT - Search Flow:**" section)
-search_flow_end = content.find('**IMPORTANT - Duplicate Handling:**')
-
-if search_flow_end == -1:
-    print("❌ Could not find insertion point")
-    exit(1)
+PROMPT_PATH = 'backend/system_prompt.txt'
+# The prompt is split across these files (prompts.py joins them); the section
+# may live in any of them - it currently sits in tool_usage_prompt.txt
+PROMPT_FILES = (PROMPT_PATH, 'backend/tool_usage_prompt.txt', 'backend/examples_prompt.txt')
+# Searched as bytes directly on the mmap (no decode; mmap.find uses CPython's fast search)
+MARKER = b'**IMPORTANT - Duplicate Handling:**'
+SENTINEL = b'**CRITICAL - LIVE RECIPE BUILDING:**'  # Present once the section is inserted
 
 # New content to insert
 new_section = '''
@@ -40,12 +40,33 @@ When a chef starts describing a recipe, you MUST use these intermediate tools IN
 
 '''
 
-# Insert the new section
-new_content = content[:search_flow_end] + new_section + content[search_flow_end:]
+# Already present in one of the prompt files - nothing to do
+for path in PROMPT_FILES:
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(SENTINEL) != -1:
+            print(f"✅ {os.path.basename(path)} already has the live recipe building section")
+            exit(0)
+
+# Map the prompt file instead of reading it into a string
+with open(PROMPT_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    # Find the insertion point (after "**IMPORTANT - Search Flow:**" section)
+    search_flow_end = mm.find(MARKER)
+    
+    if search_flow_end == -1:
+        print("❌ Could not find insertion point")
+        exit(1)
+    
+    # Splice prefix + new section + suffix into a temp file, then swap it in atomically
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(PROMPT_PATH))
+    try:
+        os.write(fd, mm[:search_flow_end])
+        os.write(fd, new_section.encode('utf-8'))
+        os.write(fd, mm[search_flow_end:])
+    finally:
+        os.close(fd)
 
-# Write back
-with open('backend/prompts.py', 'w', encoding='utf-8') as f:
-    f.write(new_content)
+os.chmod(tmp_path, os.stat(PROMPT_PATH).st_mode)  # mkstemp creates 0600
+os.replace(tmp_path, PROMPT_PATH)
 
-print("✅ Successfully updated prompts.py")
+print("✅ Successfully updated system_prompt.txt")
 print(f"Added {len(new_section)} characters of instructions")